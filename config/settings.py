@@ -2,6 +2,7 @@
 Configuration settings for Pizza Game Dashboard
 """
 import os
+from dataclasses import dataclass
 
 # S3 Configuration
 S3_BUCKET_NAME = os.environ.get('S3_BUCKET_NAME', 'pizza-game-analytics-default')
@@ -20,28 +21,54 @@ S3_FOLDERS = {
 }
 
 # API Configuration
-DOMINOS_API_CONFIG = {
-    'base_url': os.environ.get('DOMINOS_API_URL', 'https://api.dominos.com/v1'),
-    'api_key': os.environ.get('DOMINOS_API_KEY', ''),
-    'store_id': os.environ.get('DOMINOS_STORE_ID', ''),
-    'rate_limit': int(os.environ.get('DOMINOS_RATE_LIMIT', '100')),  # requests per minute
-    'timeout': int(os.environ.get('API_TIMEOUT', '30'))  # seconds
-}
+# Parsed once at import into immutable records; read as attributes
+@dataclass(frozen=True, slots=True)
+class DominosAPISettings:
+    base_url: str
+    api_key: str
+    store_id: str
+    rate_limit: int  # requests per minute
+    timeout: int  # seconds
 
-FOOTBALL_API_CONFIG = {
-    'base_url': os.environ.get('FOOTBALL_API_URL', 'https://api.football-data.org/v4'),
-    'api_key': os.environ.get('FOOTBALL_API_KEY', ''),
-    'rate_limit': int(os.environ.get('FOOTBALL_RATE_LIMIT', '60')),  # requests per minute
-    'timeout': int(os.environ.get('API_TIMEOUT', '30'))  # seconds
-}
+
+@dataclass(frozen=True, slots=True)
+class FootballAPISettings:
+    base_url: str
+    api_key: str
+    rate_limit: int  # requests per minute
+    timeout: int  # seconds
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitSettings:
+    max_requests_per_minute: int
+    max_requests_per_hour: int
+    max_retries: int
+    backoff_factor: float
+
+
+DOMINOS_API_CONFIG = DominosAPISettings(
+    base_url=os.environ.get('DOMINOS_API_URL', 'https://api.dominos.com/v1'),
+    api_key=os.environ.get('DOMINOS_API_KEY', ''),
+    store_id=os.environ.get('DOMINOS_STORE_ID', ''),
+    rate_limit=int(os.environ.get('DOMINOS_RATE_LIMIT', '100')),
+    timeout=int(os.environ.get('API_TIMEOUT', '30'))
+)
+
+FOOTBALL_API_CONFIG = FootballAPISettings(
+    base_url=os.environ.get('FOOTBALL_API_URL', 'https://api.football-data.org/v4'),
+    api_key=os.environ.get('FOOTBALL_API_KEY', ''),
+    rate_limit=int(os.environ.get('FOOTBALL_RATE_LIMIT', '60')),
+    timeout=int(os.environ.get('API_TIMEOUT', '30'))
+)
 
 # Rate Limiting Configuration
-RATE_LIMIT_CONFIG = {
-    'max_requests_per_minute': int(os.environ.get('MAX_REQUESTS_PER_MINUTE', '60')),
-    'max_requests_per_hour': int(os.environ.get('MAX_REQUESTS_PER_HOUR', '1000')),
-    'max_retries': int(os.environ.get('MAX_API_RETRIES', '3')),
-    'backoff_factor': float(os.environ.get('BACKOFF_FACTOR', '1.0'))
-}
+RATE_LIMIT_CONFIG = RateLimitSettings(
+    max_requests_per_minute=int(os.environ.get('MAX_REQUESTS_PER_MINUTE', '60')),
+    max_requests_per_hour=int(os.environ.get('MAX_REQUESTS_PER_HOUR', '1000')),
+    max_retries=int(os.environ.get('MAX_API_RETRIES', '3')),
+    backoff_factor=float(os.environ.get('BACKOFF_FACTOR', '1.0'))
+)
 
 # QuickSight Configuration
 QUICKSIGHT_CONFIG = {
@@ -54,7 +81,7 @@ QUICKSIGHT_CONFIG = {
 LAMBDA_CONFIG = {
     'timeout': 900,  # 15 minutes (maximum)
     'memory': 1024,  # MB
-    'runtime': 'python3.9'
+    'runtime': 'python3.13'
 }
 
 # Data Processing Configuration
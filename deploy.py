@@ -3,37 +3,225 @@
 Deployment script for Pizza Game Dashboard Lambda function
 Creates deployment package and uploads to AWS Lambda
 """
+import argparse
+import hashlib
 import os
+import platform
+import shutil
 import sys
+import time
 import zipfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def create_deployment_package():
+REQUIREMENTS_FILE = "requirements-lambda.txt"
+
+# Python version of the Lambda runtime the package is built for
+LAMBDA_PYTHON_VERSION = "3.13"
+
+# Bundled native libraries that break when stripped (numpy fails to import)
+STRIP_SKIP_DIRS = {"numpy.libs"}
+
+# Packages already provided by the AWS Lambda Python runtime (boto3 and its
+# dependency closure); bundling our own copy only inflates the upload
+AWS_RUNTIME_PACKAGES = (
+    "boto3", "boto3-*.dist-info",
+    "botocore", "botocore-*.dist-info",
+    "s3transfer", "s3transfer-*.dist-info",
+    "jmespath", "jmespath-*.dist-info",
+    "dateutil", "python_dateutil-*.dist-info",
+    "urllib3", "urllib3-*.dist-info",
+    "six.py", "six-*.dist-info",
+)
+
+# Source packages shipped alongside lambda_function.py
+SOURCE_PACKAGES = ("src", "config")
+SOURCE_COPY_IGNORE = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo", ".pytest_cache")
+
+# Names removed from the package by _cleanup_package (files or directories)
+CLEANUP_NAMES = {"__pycache__", ".pytest_cache", "tests"}
+CLEANUP_PREFIXES = ("test_",)
+CLEANUP_SUFFIXES = (".pyo", ".dist-info")
+
+# Persistent pip download/wheel cache shared across deploys
+PIP_CACHE_DIR = ".pip-cache"
+
+# Compressed dependency archives keyed on the requirements hash and build settings
+DEPLOY_CACHE_DIR = Path(".deploy-cache")
+
+# Maximum DEFLATE level: smaller upload to S3/Lambda at a small client-side CPU cost
+DEFAULT_COMPRESS_LEVEL = 9
+
+# Optional SIMD-accelerated DEFLATE implementations for the zip pass. They
+# write valid DEFLATE streams that any unzip can read, but not byte-identical
+# to stdlib zlib's output. isal_zlib only supports compression levels 0-3.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+try:
+    from zlib_ng import zlib_ng
+except ImportError:
+    zlib_ng = None
+
+ISAL_MAX_COMPRESS_LEVEL = 3
+
+def _deflate_module(compress_level):
     """
-    Create a deployment package for Lambda function
+    Pick the fastest installed zlib-compatible module that supports compress_level
+    
+    Args:
+        compress_level: DEFLATE level (0-9), or None for the zlib default
     """
-    print("Creating Lambda deployment package...")
+    if isal_zlib is not None and compress_level is not None and 0 <= compress_level <= ISAL_MAX_COMPRESS_LEVEL:
+        return isal_zlib
+    if zlib_ng is not None:
+        return zlib_ng
+    return zipfile.zlib
+
+def _iter_files(directory):
+    """
+    Recursively yield an os.DirEntry for every regular file under directory
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def _compress_member(entry, arcname, compression, compress_level):
+    """
+    Read and compress a single file for the deployment archive
+    
+    Args:
+        entry: os.DirEntry of the file; its cached stat() fills in the header
+        arcname: Name of the member inside the archive
+    
+    Returns:
+        Tuple of (ZipInfo with CRC and sizes filled in, compressed payload)
+    """
+    # Equivalent to ZipInfo.from_file() without a second os.stat()
+    st = entry.stat()
+    date_time = time.localtime(st.st_mtime)[0:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = compression
+    
+    with open(entry.path, 'rb') as f:
+        data = f.read()
+    
+    zinfo.file_size = len(data)
+    zinfo.CRC = zipfile.crc32(data)
+    
+    if compression == zipfile.ZIP_DEFLATED:
+        deflate = _deflate_module(compress_level)
+        level = deflate.Z_DEFAULT_COMPRESSION if compress_level is None else compress_level
+        compressor = deflate.compressobj(level, deflate.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+# ZipFile internals used by _write_precompressed_member
+PRECOMPRESSED_WRITE_ATTRS = ("fp", "start_dir", "filelist", "NameToInfo", "_didModify", "_writecheck")
+
+def _supports_precompressed_write(zipf):
+    """
+    Check that zipf exposes the ZipFile internals _write_precompressed_member relies on
+    
+    Returns False on a zipfile implementation that has refactored them, so the
+    archive is written through the public ZipFile.write() instead.
+    """
+    return (all(hasattr(zipf, name) for name in PRECOMPRESSED_WRITE_ATTRS)
+            and callable(zipf._writecheck)
+            and callable(getattr(zipfile.ZipInfo, "FileHeader", None))
+            and zipf.fp is not None and zipf.fp.seekable()
+            and not getattr(zipf, "_writing", False))
+
+def _write_precompressed_member(zipf, zinfo, payload):
+    """
+    Append an already-compressed member to an open ZipFile without recompressing it
+    
+    Mirrors ZipFile._open_to_write for the case where CRC and sizes are known upfront.
+    Only call this when _supports_precompressed_write(zipf) is True.
+    """
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
     
-    # Create deployment directory
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(payload)
+    
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+def _dependency_cache_path(compression, compress_level):
+    """
+    Get the cached dependency archive path for the current requirements and build settings
+    
+    Besides the requirements and ZIP settings, the key covers everything else
+    that changes the built archive: the target runtime, the host platform and
+    interpreter (bytecode compilation and stripping depend on them), whether
+    strip is available, and the prune/cleanup rules.
+    """
+    digest = hashlib.sha256(Path(REQUIREMENTS_FILE).read_bytes())
+    build_settings = (
+        compression, compress_level,
+        LAMBDA_PYTHON_VERSION,
+        sys.platform, platform.machine(), sys.version_info[:2],
+        _strip_command() is not None,
+        AWS_RUNTIME_PACKAGES,
+        sorted(CLEANUP_NAMES), CLEANUP_PREFIXES, CLEANUP_SUFFIXES,
+        sorted(STRIP_SKIP_DIRS),
+    )
+    digest.update(repr(build_settings).encode())
+    return DEPLOY_CACHE_DIR / f"{digest.hexdigest()[:16]}.zip"
+
+def _prepare_deploy_dir():
+    """
+    Create an empty staging directory for the deployment package
+    """
     deploy_dir = Path("deploy")
     if deploy_dir.exists():
-        import shutil
         shutil.rmtree(deploy_dir)
     deploy_dir.mkdir(exist_ok=True)
+    return deploy_dir
+
+# Outcomes of _install_dependencies
+INSTALL_TARGETED = "targeted"
+INSTALL_HOST_FALLBACK = "host-fallback"
+
+def _install_dependencies(deploy_dir):
+    """
+    Install Lambda dependencies into the staging directory
+    
+    The staging directory is always freshly created, so no --upgrade is
+    passed; pip can then satisfy the pinned requirements from its cache.
     
-    # Install minimal dependencies for Lambda with Linux platform targeting
-    print("Installing minimal dependencies for Lambda...")
+    Returns:
+        INSTALL_TARGETED if the Linux x86_64 wheels were installed,
+        INSTALL_HOST_FALLBACK if that failed and host-platform wheels were
+        installed instead, or None if installation failed
+    """
     try:
         subprocess.run([
             sys.executable, "-m", "pip", "install", 
-            "-r", "requirements-lambda.txt", 
+            "-r", REQUIREMENTS_FILE, 
             "-t", str(deploy_dir),
             "--platform", "linux_x86_64",
             "--implementation", "cp",
-            "--python-version", "3.13",
+            "--python-version", LAMBDA_PYTHON_VERSION,
             "--only-binary=:all:",
-            "--upgrade"
+            "--cache-dir", PIP_CACHE_DIR
         ], check=True)
     except subprocess.CalledProcessError as e:
         print(f"Error installing with Linux platform targeting: {e}")
@@ -43,61 +231,219 @@ def create_deployment_package():
         try:
             subprocess.run([
                 sys.executable, "-m", "pip", "install", 
-                "-r", "requirements-lambda.txt", 
+                "-r", REQUIREMENTS_FILE, 
                 "-t", str(deploy_dir),
-                "--upgrade"
+                "--only-binary=:all:",
+                "--cache-dir", PIP_CACHE_DIR
             ], check=True)
         except subprocess.CalledProcessError as e2:
             print(f"Error installing dependencies: {e2}")
             return None
+        
+        return INSTALL_HOST_FALLBACK
     
-    # Copy source code to deployment directory
-    print("Copying source code...")
+    return INSTALL_TARGETED
+
+def _copy_sources(deploy_dir):
+    """
+    Copy the Lambda handler and source packages into the staging directory
     
+    Uses in-process shutil copies (sendfile/copy_file_range on Linux) rather
+    than spawning cp, and skips bytecode caches at copy time.
+    """
     # Copy main Lambda handler
-    import shutil
     shutil.copy2("lambda_function.py", deploy_dir)
     
     # Copy source packages
-    if Path("src").exists():
-        shutil.copytree("src", deploy_dir / "src")
-    if Path("config").exists():
-        shutil.copytree("config", deploy_dir / "config")
-    
-    # Remove unnecessary files to reduce package size
+    for package in SOURCE_PACKAGES:
+        if Path(package).exists():
+            shutil.copytree(package, deploy_dir / package,
+                            ignore=SOURCE_COPY_IGNORE, dirs_exist_ok=True)
+
+def _prune_runtime_packages(deploy_dir):
+    """
+    Remove packages that the Lambda runtime already provides
+    """
+    print("Pruning packages provided by the Lambda runtime...")
+    for pattern in AWS_RUNTIME_PACKAGES:
+        for path in deploy_dir.glob(pattern):
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+def _cleanup_package(deploy_dir):
+    """
+    Remove unnecessary files to reduce package size
+    """
     print("Cleaning up deployment package...")
-    cleanup_patterns = [
-        "**/__pycache__",
-        "**/*.pyc",
-        "**/*.pyo",
-        "**/.pytest_cache",
-        "**/tests",
-        "**/*.dist-info",
-        "**/test_*"
+    
+    def is_removable(name):
+        return (name in CLEANUP_NAMES
+                or name.startswith(CLEANUP_PREFIXES)
+                or name.endswith(CLEANUP_SUFFIXES))
+    
+    # Single top-down walk; removed directories are pruned from the walk
+    for root, dirs, files in os.walk(deploy_dir):
+        kept_dirs = []
+        for name in dirs:
+            if is_removable(name):
+                shutil.rmtree(os.path.join(root, name))
+            else:
+                kept_dirs.append(name)
+        dirs[:] = kept_dirs
+        
+        for name in files:
+            if is_removable(name):
+                os.unlink(os.path.join(root, name))
+
+def _strip_command():
+    """
+    Get the path to GNU strip, or None when shared libraries cannot be stripped here
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    return shutil.which("strip")
+
+def _strip_shared_objects(deploy_dir):
+    """
+    Strip debug symbols from bundled shared libraries to shrink the package
+    """
+    strip = _strip_command()
+    if strip is None:
+        print("Skipping shared library stripping (GNU strip not available)")
+        return
+    
+    shared_objects = [
+        str(path) for path in deploy_dir.rglob("*.so*")
+        if path.is_file() and STRIP_SKIP_DIRS.isdisjoint(path.parts)
     ]
     
-    import glob
-    for pattern in cleanup_patterns:
-        for path in glob.glob(str(deploy_dir / pattern), recursive=True):
-            path_obj = Path(path)
-            if path_obj.is_file():
-                path_obj.unlink()
-            elif path_obj.is_dir():
-                shutil.rmtree(path_obj)
+    print(f"Stripping {len(shared_objects)} shared libraries...")
+    for i in range(0, len(shared_objects), 200):
+        subprocess.run([strip, "--strip-unneeded", *shared_objects[i:i + 200]], check=False)
+
+def _compile_to_bytecode(deploy_dir):
+    """
+    Replace dependency .py sources with legacy-layout .pyc files
+    
+    Sourceless bytecode is only importable by the interpreter version that
+    wrote it, so this is skipped unless the local Python matches the runtime.
+    """
+    local_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    if local_version != LAMBDA_PYTHON_VERSION:
+        print(f"Skipping bytecode compilation (local Python {local_version}, "
+              f"Lambda runtime {LAMBDA_PYTHON_VERSION})")
+        return
+    
+    print("Compiling dependencies to bytecode...")
+    subprocess.run(
+        [sys.executable, "-m", "compileall", "-b", "-f", "-q", "-j", "0",
+         "--invalidation-mode", "unchecked-hash", str(deploy_dir)],
+        check=False
+    )
+    
+    # Only drop sources that compiled successfully
+    for py_file in deploy_dir.rglob("*.py"):
+        if py_file.with_suffix(".pyc").exists():
+            py_file.unlink()
+
+def _zip_directory(zipf, source_dir, compression, compress_level):
+    """
+    Add every file under source_dir to an open ZipFile
+    
+    Members are compressed concurrently (zlib releases the GIL), then appended
+    to the archive sequentially in walk order. Falls back to a sequential
+    ZipFile.write() when the ZipFile internals needed for that are missing.
+    """
+    # Arcnames are the entry paths with the source_dir prefix sliced off
+    prefix_len = len(os.path.join(str(source_dir), ""))
+    members = [(entry, entry.path[prefix_len:]) for entry in _iter_files(source_dir)]
+    
+    if not _supports_precompressed_write(zipf):
+        for entry, arcname in members:
+            zipf.write(entry.path, arcname, compression, compress_level)
+        return
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        compressed_members = executor.map(
+            lambda member: _compress_member(member[0], member[1], compression, compress_level),
+            members
+        )
+        for zinfo, payload in compressed_members:
+            _write_precompressed_member(zipf, zinfo, payload)
+
+def create_deployment_package(compression=zipfile.ZIP_DEFLATED, compress_level=DEFAULT_COMPRESS_LEVEL,
+                              use_cache=True):
+    """
+    Create a deployment package for Lambda function
+    
+    Args:
+        compression: zipfile compression method (ZIP_DEFLATED or ZIP_STORED)
+        compress_level: DEFLATE level (0-9), ignored for ZIP_STORED
+        use_cache: Reuse the cached dependency archive when requirements are unchanged
+    """
+    print("Creating Lambda deployment package...")
     
-    # Create ZIP file
     zip_path = "pizza-game-dashboard.zip"
-    print(f"Creating ZIP file: {zip_path}")
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(deploy_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, deploy_dir)
-                zipf.write(file_path, arcname)
+    # Stored archives skip the zlib pass entirely; compresslevel only applies to DEFLATE
+    if compression == zipfile.ZIP_STORED:
+        compress_level = None
+    
+    # Dependencies only change when requirements-lambda.txt does, so their
+    # compressed archive is cached and reused as the prefix of every package
+    deps_zip = _dependency_cache_path(compression, compress_level)
+    uncached_deps_zip = None
+    if use_cache and deps_zip.exists():
+        print(f"Reusing cached dependency archive: {deps_zip}")
+    else:
+        deploy_dir = _prepare_deploy_dir()
+        
+        # Install minimal dependencies for Lambda with Linux platform targeting
+        print("Installing minimal dependencies for Lambda...")
+        install_result = _install_dependencies(deploy_dir)
+        if install_result is None:
+            return None
+        
+        _prune_runtime_packages(deploy_dir)
+        _cleanup_package(deploy_dir)
+        _strip_shared_objects(deploy_dir)
+        _compile_to_bytecode(deploy_dir)
+        
+        if install_result == INSTALL_TARGETED:
+            print(f"Caching dependency archive: {deps_zip}")
+            DEPLOY_CACHE_DIR.mkdir(exist_ok=True)
+        else:
+            # Host-platform wheels may not run on Lambda; never let a later
+            # deploy silently reuse them
+            deps_zip = uncached_deps_zip = Path("deploy-dependencies.zip")
+            print("WARNING: Dependencies were installed for the host platform; not caching them")
+        tmp_zip = deps_zip.with_suffix(".tmp")
+        with zipfile.ZipFile(tmp_zip, 'w', compression, compresslevel=compress_level) as zipf:
+            _zip_directory(zipf, deploy_dir, compression, compress_level)
+        os.replace(tmp_zip, deps_zip)
+        
+        shutil.rmtree(deploy_dir)
+    
+    # Copy source code to deployment directory
+    print("Copying source code...")
+    deploy_dir = _prepare_deploy_dir()
+    
+    _copy_sources(deploy_dir)
+    
+    _cleanup_package(deploy_dir)
+    
+    # Create ZIP file from the cached dependency prefix plus the source files
+    print(f"Creating ZIP file: {zip_path}")
+    shutil.copyfile(deps_zip, zip_path)
+    with zipfile.ZipFile(zip_path, 'a', compression, compresslevel=compress_level) as zipf:
+        _zip_directory(zipf, deploy_dir, compression, compress_level)
     
     # Clean up deployment directory
     shutil.rmtree(deploy_dir)
+    if uncached_deps_zip is not None:
+        uncached_deps_zip.unlink()
     
     print(f"Deployment package created: {zip_path}")
     print(f"Package size: {os.path.getsize(zip_path) / 1024 / 1024:.2f} MB")
@@ -124,18 +470,39 @@ def deploy_with_sam():
         "--capabilities", "CAPABILITY_IAM"
     ], check=True)
 
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the deployment script
+    """
+    parser = argparse.ArgumentParser(description="Package and deploy the Pizza Game Dashboard Lambda")
+    parser.add_argument("--sam", action="store_true",
+                        help="Deploy using SAM CLI instead of building a ZIP package")
+    parser.add_argument("--no-compression", action="store_true",
+                        help="Store files uncompressed (ZIP_STORED) for faster packaging")
+    parser.add_argument("--compress-level", type=int, choices=range(0, 10), metavar="N",
+                        default=DEFAULT_COMPRESS_LEVEL,
+                        help=f"DEFLATE compression level 0-9 (default: {DEFAULT_COMPRESS_LEVEL})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rebuild the dependency archive instead of reusing .deploy-cache/")
+    return parser.parse_args(argv)
+
 def main():
     """
     Main deployment function
     """
-    if len(sys.argv) > 1 and sys.argv[1] == "--sam":
+    args = parse_args()
+    
+    if args.sam:
         deploy_with_sam()
     else:
-        create_deployment_package()
+        compression = zipfile.ZIP_STORED if args.no_compression else zipfile.ZIP_DEFLATED
+        create_deployment_package(compression=compression, compress_level=args.compress_level,
+                                  use_cache=not args.no_cache)
         print("\nDeployment package created successfully!")
         print("To deploy:")
         print("1. Upload pizza-game-dashboard.zip to AWS Lambda console")
         print("2. Or use: python deploy.py --sam (requires SAM CLI)")
+        print("Options: --no-compression (faster packaging), --compress-level N (0-9)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,6 +8,7 @@ Set the FOOTBALL_API_KEY environment variable before running this script.
 
 import os
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
 
 # Add src to path for imports
@@ -81,13 +82,13 @@ def main():
         
         # Show data source breakdown
         if pizza_orders:
-            real_orders = sum(1 for order in pizza_orders if order.data_source == 'real')
-            mock_orders = len(pizza_orders) - real_orders
+            order_sources = Counter(order.data_source for order in pizza_orders)
+            real_orders, mock_orders = order_sources['real'], order_sources['mock']
             print(f"   🍕 Pizza orders - Real: {real_orders}, Mock: {mock_orders}")
         
         if football_matches:
-            real_matches = sum(1 for match in football_matches if match.data_source == 'real')
-            mock_matches = len(football_matches) - real_matches
+            match_sources = Counter(match.data_source for match in football_matches)
+            real_matches, mock_matches = match_sources['real'], match_sources['mock']
             print(f"   ⚽ Football matches - Real: {real_matches}, Mock: {mock_matches}")
         
         print()
@@ -2,11 +2,72 @@
 """
 Local development environment setup for Pizza Game Dashboard
 """
+import functools
+import json
 import os
-import sys
 import subprocess
+import sys
+import tempfile
+import venv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+REQUIREMENTS_FILE = "requirements.txt"
+
+_IS_WINDOWS = os.name == 'nt'
+
+# Project-local pip cache (shared with deploy.py) so built wheels are reused
+PIP_CACHE_DIR = ".pip-cache"
+
+# Concurrent pip processes used to install the resolved requirement shards
+MAX_PARALLEL_INSTALLS = min(4, os.cpu_count() or 1)
+
+# Template written to .env for local development
+ENV_TEMPLATE = b"""# Pizza Game Dashboard - Local Development Environment Variables
+
+# S3 Configuration
+S3_BUCKET_NAME=pizza-game-analytics-dev
+AWS_REGION=us-east-1
+
+# API Keys (replace with actual keys)
+DOMINOS_API_KEY=your_dominos_api_key_here
+FOOTBALL_API_KEY=your_football_api_key_here
+
+# QuickSight Configuration
+QUICKSIGHT_ACCOUNT_ID=your_aws_account_id_here
+
+# Development Settings
+ENVIRONMENT=development
+LOG_LEVEL=DEBUG
+"""
+
+# Local mirror of the S3 layout: every directory, including shared
+# ancestors, listed once with parents before their children
+_S3_FOLDERS = (
+    "local_data",
+    "local_data/raw-data",
+    "local_data/raw-data/dominos-orders",
+    "local_data/raw-data/dominos-orders/real",
+    "local_data/raw-data/dominos-orders/mock",
+    "local_data/raw-data/football-data",
+    "local_data/raw-data/football-data/real",
+    "local_data/raw-data/football-data/mock",
+    "local_data/processed-data",
+    "local_data/processed-data/merged-datasets",
+    "local_data/processed-data/correlation-analysis",
+    "local_data/quicksight-ready",
+    "local_data/quicksight-ready/dashboard-data",
+    "local_data/quicksight-ready/metadata",
+)
+LOCAL_DATA_SENTINEL = "local_data/.initialized"
+
+@functools.lru_cache(maxsize=1)
+def _venv_bin(venv_path):
+    """
+    Return the directory holding a venv's scripts for the current OS
+    """
+    return venv_path / ("Scripts" if _IS_WINDOWS else "bin")
+
 def setup_virtual_environment():
     """
     Set up Python virtual environment
@@ -14,32 +75,112 @@ def setup_virtual_environment():
     print("Setting up virtual environment...")
     
     venv_path = Path("venv")
-    if not venv_path.exists():
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
-        print("Virtual environment created: venv/")
-    else:
+    # A single stat of the marker file; a bare directory is not a usable venv
+    try:
+        os.stat(venv_path / "pyvenv.cfg")
         print("Virtual environment already exists: venv/")
+    except FileNotFoundError:
+        # In-process equivalent of `python -m venv venv`
+        venv.EnvBuilder(with_pip=True).create(str(venv_path))
+        print("Virtual environment created: venv/")
     
     # Determine activation script path based on OS
-    if os.name == 'nt':  # Windows
-        activate_script = venv_path / "Scripts" / "activate.bat"
-        pip_path = venv_path / "Scripts" / "pip"
-    else:  # Unix/Linux/macOS
-        activate_script = venv_path / "bin" / "activate"
-        pip_path = venv_path / "bin" / "pip"
+    bin_path = _venv_bin(venv_path)
+    activate_script = bin_path / ("activate.bat" if _IS_WINDOWS else "activate")
+    pip_path = bin_path / "pip"
     
     print(f"To activate: {activate_script}")
     return pip_path
 
+def _bootstrap_packaging_tools(pip_path):
+    """
+    Upgrade pip and install wheel/setuptools so sdists are built into cached wheels
+    """
+    # pip cannot replace its own script on Windows, so go through the interpreter
+    python_path = pip_path.with_name("python")
+    subprocess.run([
+        str(python_path), "-m", "pip", "install", "--upgrade",
+        "--cache-dir", PIP_CACHE_DIR, "pip", "wheel", "setuptools"
+    ], check=True)
+
+def _run_pip(pip_path, args):
+    """
+    Run a pip command, in-process when the venv is the running interpreter
+    
+    Otherwise (the usual case on first setup) a pip subprocess is started.
+    pip's internals are not thread-safe, so this is only used for calls
+    that are never made concurrently.
+    
+    Raises:
+        subprocess.CalledProcessError: If pip exits with a non-zero status
+    """
+    if Path(sys.prefix).resolve() == pip_path.parent.parent.resolve():
+        try:
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            pip_main = None
+        
+        if pip_main is not None:
+            status = pip_main(list(args))
+            if status:
+                raise subprocess.CalledProcessError(status, ["pip", *args])
+            return
+    
+    subprocess.run([str(pip_path), *args], check=True)
+
+def _resolve_requirements(pip_path):
+    """
+    Resolve the full dependency closure once with pip's resolver
+    
+    Returns:
+        List of pinned "name==version" requirement strings
+    """
+    with tempfile.TemporaryDirectory() as report_dir:
+        report_path = Path(report_dir) / "report.json"
+        _run_pip(pip_path, [
+            "install", "--dry-run", "--ignore-installed", "--quiet",
+            "--prefer-binary", "--cache-dir", PIP_CACHE_DIR,
+            "--report", str(report_path), "-r", REQUIREMENTS_FILE
+        ])
+        report = json.loads(report_path.read_text())
+    
+    return [
+        f"{item['metadata']['name']}=={item['metadata']['version']}"
+        for item in report["install"]
+    ]
+
 def install_dependencies(pip_path):
     """
     Install project dependencies
+    
+    The requirements are resolved in a single pass, then the pinned set is
+    split into shards installed concurrently with --no-deps, so the parallel
+    pip processes never run their own (racing) resolution.
     """
     print("Installing dependencies...")
     
-    subprocess.run([
-        str(pip_path), "install", "-r", "requirements.txt"
-    ], check=True)
+    _bootstrap_packaging_tools(pip_path)
+    pinned = _resolve_requirements(pip_path)
+    shard_count = min(MAX_PARALLEL_INSTALLS, len(pinned))
+    shards = [pinned[i::shard_count] for i in range(shard_count)]
+    
+    install_args = ["install", "--no-deps", "--prefer-binary", "--cache-dir", PIP_CACHE_DIR]
+    
+    if shard_count == 1:
+        _run_pip(pip_path, install_args + pinned)
+    elif shard_count > 1:
+        with ThreadPoolExecutor(max_workers=shard_count) as executor:
+            futures = [
+                executor.submit(
+                    subprocess.run,
+                    [str(pip_path), *install_args, *shard],
+                    check=True
+                )
+                for shard in shards
+            ]
+            # Re-raise the first CalledProcessError, as check=True did before
+            for future in as_completed(futures):
+                future.result()
     
     print("Dependencies installed successfully!")
 
@@ -48,28 +189,19 @@ def create_env_file():
     Create .env file template for local development
     """
     env_file = Path(".env")
-    if not env_file.exists():
-        env_content = """# Pizza Game Dashboard - Local Development Environment Variables
-
-# S3 Configuration
-S3_BUCKET_NAME=pizza-game-analytics-dev
-AWS_REGION=us-east-1
-
-# API Keys (replace with actual keys)
-DOMINOS_API_KEY=your_dominos_api_key_here
-FOOTBALL_API_KEY=your_football_api_key_here
-
-# QuickSight Configuration
-QUICKSIGHT_ACCOUNT_ID=your_aws_account_id_here
-
-# Development Settings
-ENVIRONMENT=development
-LOG_LEVEL=DEBUG
-"""
-        env_file.write_text(env_content)
-        print("Created .env file template")
-    else:
+    
+    # O_EXCL: a single open() instead of exists() followed by a write
+    try:
+        fd = os.open(env_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
         print(".env file already exists")
+        return
+    
+    try:
+        os.write(fd, ENV_TEMPLATE)
+    finally:
+        os.close(fd)
+    print("Created .env file template")
 
 def setup_local_s3_structure():
     """
@@ -77,19 +209,22 @@ def setup_local_s3_structure():
     """
     print("Creating local S3 folder structure...")
     
-    folders = [
-        "local_data/raw-data/dominos-orders/real",
-        "local_data/raw-data/dominos-orders/mock",
-        "local_data/raw-data/football-data/real", 
-        "local_data/raw-data/football-data/mock",
-        "local_data/processed-data/merged-datasets",
-        "local_data/processed-data/correlation-analysis",
-        "local_data/quicksight-ready/dashboard-data",
-        "local_data/quicksight-ready/metadata"
-    ]
+    # Written last, so its presence means every folder already exists
+    sentinel = Path(LOCAL_DATA_SENTINEL)
+    try:
+        os.stat(sentinel)
+        print("Local data folders already exist in: local_data/")
+        return
+    except FileNotFoundError:
+        pass
     
-    for folder in folders:
-        Path(folder).mkdir(parents=True, exist_ok=True)
+    # Parents precede children, so a plain mkdir per directory suffices
+    for directory in _S3_FOLDERS:
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+    sentinel.touch()
     
     print("Local data folders created in: local_data/")
 
@@ -111,18 +246,24 @@ def main():
     # Setup local folder structure
     setup_local_s3_structure()
     
-    print("\n" + "="*50)
-    print("Development environment setup complete!")
-    print("="*50)
-    print("Next steps:")
-    print("1. Activate virtual environment:")
-    if os.name == 'nt':
-        print("   venv\\Scripts\\activate")
-    else:
-        print("   source venv/bin/activate")
-    print("2. Update .env file with your API keys")
-    print("3. Run tests: python -m pytest tests/")
-    print("4. Run locally: python lambda_function.py")
+    activate_script = _venv_bin(Path("venv")) / "activate"
+    activate_command = str(activate_script) if _IS_WINDOWS else f"source {activate_script}"
+    
+    # One write for the whole banner instead of a print() per line
+    banner = "\n".join([
+        "",
+        "=" * 50,
+        "Development environment setup complete!",
+        "=" * 50,
+        "Next steps:",
+        "1. Activate virtual environment:",
+        f"   {activate_command}",
+        "2. Update .env file with your API keys",
+        "3. Run tests: python -m pytest tests/",
+        "4. Run locally: python lambda_function.py",
+    ])
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,23 +5,25 @@ This module provides functionality for collecting data from both external APIs
 and mock data generators for pizza orders and football matches.
 """
 
-from .mock_generators import (
-    MockDataGenerator,
-    GeneratorConfig,
-    create_default_config,
-    generate_correlated_dataset
-)
-
-from .external_collectors import (
-    ExternalDataCollector,
-    DominosAPIClient,
-    FootballAPIClient,
-    DataCollectionSystem,
-    APIConfig,
-    RateLimiter,
-    create_default_api_config,
-    create_api_config_from_env
-)
+import importlib
+
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562) so importing the package
+# does not pull in requests and the generators until they are used.
+_LAZY_ATTRIBUTES = {
+    'MockDataGenerator': 'mock_generators',
+    'GeneratorConfig': 'mock_generators',
+    'create_default_config': 'mock_generators',
+    'generate_correlated_dataset': 'mock_generators',
+    'ExternalDataCollector': 'external_collectors',
+    'DominosAPIClient': 'external_collectors',
+    'FootballAPIClient': 'external_collectors',
+    'DataCollectionSystem': 'external_collectors',
+    'APIConfig': 'external_collectors',
+    'RateLimiter': 'external_collectors',
+    'create_default_api_config': 'external_collectors',
+    'create_api_config_from_env': 'external_collectors'
+}
 
 __all__ = [
     'MockDataGenerator',
@@ -36,4 +38,19 @@ __all__ = [
     'RateLimiter',
     'create_default_api_config',
     'create_api_config_from_env'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -34,14 +34,19 @@ Requirements Satisfied:
 
 import time
 import random
+import threading
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit
 from dataclasses import dataclass
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import json
+import orjson
 
 from ..models.pizza_order import DominosOrder
 from ..models.football_match import FootballMatch
@@ -52,10 +57,22 @@ from .mock_generators import MockDataGenerator, GeneratorConfig, create_default_
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP adapter: one pool per API host,
+# each keeping enough connections alive for a multi-day collection run
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
 
-@dataclass
+# Upper bound on computed retry backoff and on the Retry-After delay
+# honored by ExternalDataCollector._make_request
+MAX_BACKOFF_SECONDS = 60
+
+# Longest date range requested from the Domino's orders endpoint at once
+DOMINOS_QUERY_WINDOW = timedelta(days=30)
+
+
+@dataclass(slots=True, frozen=True)
 class APIConfig:
-    """Configuration for external API clients."""
+    """Configuration for external API clients (immutable once created)."""
     
     # Domino's API configuration
     dominos_api_url: str = "https://api.dominos.com/v1"
@@ -73,15 +90,77 @@ class APIConfig:
     # Retry configuration
     max_retries: int = 3
     backoff_factor: float = 1.0
-    retry_status_codes: List[int] = None
+    retry_status_codes: Tuple[int, ...] = (429, 500, 502, 503, 504)
     
     # Timeout configuration
     request_timeout: int = 30
+
+
+class SlidingWindowCounter:
+    """
+    Request counter over a sliding time window split into fixed-width buckets.
     
-    def __post_init__(self):
-        """Set default retry status codes if not provided."""
-        if self.retry_status_codes is None:
-            self.retry_status_codes = [429, 500, 502, 503, 504]
+    Only a count per bucket and a running total are stored, so memory is
+    O(number of buckets) no matter how many requests are made. One bucket
+    beyond the window is kept, which means a request is never dropped from
+    the count before it is a full window old (the limiter errs towards
+    waiting up to one bucket longer, never towards exceeding the limit).
+    """
+    
+    def __init__(self, window_seconds: int, bucket_seconds: int):
+        """
+        Initialize an empty window.
+        
+        Args:
+            window_seconds: Length of the sliding window
+            bucket_seconds: Width of each bucket (the counting resolution)
+        """
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = window_seconds // bucket_seconds + 1
+        self.buckets = [0] * self.num_buckets
+        self.head = None  # Absolute index of the newest bucket
+        self.count = 0    # Requests currently inside the window
+    
+    def advance(self, now: float) -> None:
+        """Move the window forward to 'now', expiring buckets that left it."""
+        index = int(now // self.bucket_seconds)
+        if self.head is None:
+            self.head = index
+            return
+        
+        steps = index - self.head
+        if steps <= 0:
+            return
+        
+        buckets = self.buckets
+        if steps >= self.num_buckets:
+            # Idle for longer than the whole window: everything expired
+            for slot in range(self.num_buckets):
+                buckets[slot] = 0
+            self.count = 0
+        else:
+            for absolute_index in range(self.head + 1, index + 1):
+                slot = absolute_index % self.num_buckets
+                self.count -= buckets[slot]
+                buckets[slot] = 0
+        self.head = index
+    
+    def record(self, now: float) -> None:
+        """Count a request made at 'now'."""
+        self.advance(now)
+        self.buckets[self.head % self.num_buckets] += 1
+        self.count += 1
+    
+    def seconds_until_expiry(self, now: float) -> float:
+        """Seconds until the oldest counted bucket leaves the window."""
+        if self.head is None:
+            return 0.0
+        
+        for offset in range(self.num_buckets - 1, -1, -1):
+            absolute_index = self.head - offset
+            if self.buckets[absolute_index % self.num_buckets]:
+                return (absolute_index + self.num_buckets) * self.bucket_seconds - now
+        return 0.0
 
 
 class RateLimiter:
@@ -94,13 +173,17 @@ class RateLimiter:
     temporary API access suspension.
     
     Algorithm:
-    1. Maintain lists of request timestamps for minute and hour windows
-    2. Before each request, clean expired timestamps from tracking lists
+    1. Maintain bucketed request counters for minute and hour windows
+       (one-second buckets for the minute, one-minute buckets for the hour)
+    2. Before each request, advance both windows, expiring old buckets
     3. Check if current request count would exceed limits
     4. If limit would be exceeded, calculate sleep time and wait
-    5. Record successful request timestamp for future limit calculations
+    5. Count the request in both windows for future limit calculations
     
-    Thread Safety: Not thread-safe. Use separate instances for concurrent access.
+    Thread Safety: wait_if_needed holds a lock for the whole check-sleep-record
+    sequence, so one instance can be shared across threads (the per-host
+    instances in _RATE_LIMITERS are). Concurrent callers queue on the lock and
+    are admitted one at a time as the windows allow.
     """
     
     def __init__(self, max_per_minute: int = 60, max_per_hour: int = 1000):
@@ -118,105 +201,236 @@ class RateLimiter:
         self.max_per_minute = max_per_minute
         self.max_per_hour = max_per_hour
         
-        # Track request timestamps in sliding windows
-        # Each list contains Unix timestamps of recent requests
-        self.minute_requests = []  # Requests in last 60 seconds
-        self.hour_requests = []    # Requests in last 3600 seconds
+        # Request counts in sliding windows; memory is fixed per window
+        self.minute_window = SlidingWindowCounter(60, 1)   # Last 60 seconds
+        self.hour_window = SlidingWindowCounter(3600, 60)  # Last 3600 seconds
+        self._lock = threading.Lock()
     
     def wait_if_needed(self) -> None:
         """
         Wait if necessary to respect rate limits using sliding window algorithm.
         
         This method implements proactive rate limiting to prevent 429 errors:
-        1. Clean expired timestamps from tracking windows
+        1. Expire buckets that have left the tracking windows
         2. Check if making a request now would exceed limits
         3. If so, calculate minimum wait time and sleep
-        4. Record the request timestamp for future calculations
+        4. Count the request for future calculations
         
         The algorithm ensures we never exceed limits by waiting for the oldest
-        request in the window to expire before making a new request.
+        counted bucket in the window to expire before making a new request.
         
         Performance Note: This method blocks the calling thread when rate limits
         are approached. For high-throughput scenarios, consider async alternatives.
         """
-        now = time.time()
-        
-        # Clean expired requests from sliding windows
-        # Remove requests older than 60 seconds from minute window
-        self.minute_requests = [req_time for req_time in self.minute_requests 
-                               if now - req_time < 60]
-        
-        # Remove requests older than 3600 seconds (1 hour) from hour window
-        self.hour_requests = [req_time for req_time in self.hour_requests 
-                             if now - req_time < 3600]
-        
-        # Check minute-level rate limit
-        if len(self.minute_requests) >= self.max_per_minute:
-            # Calculate how long to wait for oldest request to expire
-            oldest_request = self.minute_requests[0]
-            sleep_time = 60 - (now - oldest_request)
+        with self._lock:
+            now = time.time()
+            minute_window = self.minute_window
+            hour_window = self.hour_window
             
-            if sleep_time > 0:
-                logger.info(f"Minute rate limit reached ({len(self.minute_requests)}/{self.max_per_minute}), "
-                           f"sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+            # Check minute-level rate limit
+            minute_window.advance(now)
+            if minute_window.count >= self.max_per_minute:
+                # Calculate how long to wait for the oldest bucket to expire
+                sleep_time = minute_window.seconds_until_expiry(now)
                 
-                # Update 'now' after sleeping
-                now = time.time()
-        
-        # Check hour-level rate limit
-        if len(self.hour_requests) >= self.max_per_hour:
-            # Calculate how long to wait for oldest request to expire
-            oldest_request = self.hour_requests[0]
-            sleep_time = 3600 - (now - oldest_request)
+                if sleep_time > 0:
+                    logger.info("Minute rate limit reached (%d/%d), sleeping for %.2f seconds",
+                                minute_window.count, self.max_per_minute, sleep_time)
+                    time.sleep(sleep_time)
+                    
+                    # Update 'now' after sleeping
+                    now = time.time()
             
-            if sleep_time > 0:
-                logger.info(f"Hourly rate limit reached ({len(self.hour_requests)}/{self.max_per_hour}), "
-                           f"sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+            # Check hour-level rate limit
+            hour_window.advance(now)
+            if hour_window.count >= self.max_per_hour:
+                # Calculate how long to wait for the oldest bucket to expire
+                sleep_time = hour_window.seconds_until_expiry(now)
                 
-                # Update 'now' after sleeping
-                now = time.time()
+                if sleep_time > 0:
+                    logger.info("Hourly rate limit reached (%d/%d), sleeping for %.2f seconds",
+                                hour_window.count, self.max_per_hour, sleep_time)
+                    time.sleep(sleep_time)
+                    
+                    # Update 'now' after sleeping
+                    now = time.time()
+            
+            # Count this request in both windows
+            # This ensures future calls will account for this request
+            minute_window.record(now)
+            hour_window.record(now)
+
+
+# Rate limiters shared by every collector in the process, keyed on API host and
+# limits, so warm Lambda invocations keep counting against the same quota
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(host: str, max_per_minute: int, max_per_hour: int) -> RateLimiter:
+    """
+    Return the process-wide rate limiter for an API host.
+    
+    Args:
+        host: API host the limits apply to
+        max_per_minute: Maximum requests per minute
+        max_per_hour: Maximum requests per hour
         
-        # Record this request timestamp in both windows
-        # This ensures future calls will account for this request
-        self.minute_requests.append(now)
-        self.hour_requests.append(now)
+    Returns:
+        RateLimiter shared by all collectors using the same host and limits
+    """
+    key = f"{host}:{max_per_minute}:{max_per_hour}"
+    limiter = _RATE_LIMITERS.get(key)
+    if limiter is None:
+        limiter = _RATE_LIMITERS.setdefault(key, RateLimiter(max_per_minute, max_per_hour))
+    return limiter
+
+
+def has_dominos_credentials(config: APIConfig) -> bool:
+    """Whether config allows calling the real Domino's API."""
+    return bool(config.dominos_api_key and config.dominos_store_id)
+
+
+def has_football_credentials(config: APIConfig) -> bool:
+    """Whether config allows calling the real football API."""
+    return bool(config.football_api_key)
+
+
+def create_http_session(config: APIConfig) -> requests.Session:
+    """
+    Create an HTTP session with a pooled keep-alive adapter.
+    
+    A single session can be shared by several API clients so that TCP/TLS
+    connections are reused across them instead of each client paying its
+    own handshakes. Retries are not delegated to urllib3; they are handled
+    by ExternalDataCollector so Retry-After and the rate limiter are honored.
+    
+    Args:
+        config: API configuration parameters
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=0, read=False)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    return session
+
+
+def compute_backoff(backoff_factor: float, attempt: int) -> float:
+    """
+    Capped exponential backoff with jitter for a zero-based retry attempt.
+    
+    The delay doubles with each attempt up to MAX_BACKOFF_SECONDS, plus up to
+    one backoff_factor of random jitter so concurrent clients do not retry
+    in lockstep.
+    
+    Args:
+        backoff_factor: Base delay in seconds
+        attempt: Number of retries already made
+        
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    backoff = min(MAX_BACKOFF_SECONDS, backoff_factor * (2 ** attempt))
+    return backoff + random.random() * backoff_factor
+
+
+# Event type indexed by sign(home_score - away_score): 0 draw, 1 win, -1 loss
+_EVENT_TYPE_BY_SIGN = ('draw', 'win', 'loss')
+
+
+# football-data.org competition stages treated as finals; every stage other
+# than these and REGULAR_SEASON counts as a tournament match
+_FINAL_STAGES = frozenset({
+    'FINAL', 'SEMI_FINALS', 'SEMI_FINAL', 'QUARTER_FINALS', 'QUARTER_FINAL',
+})
 
 
 class ExternalDataCollector:
     """
     Base class for external API data collection with error handling and fallback.
+    
+    Successful GET responses are kept in a small in-memory LRU cache keyed on
+    (url, params, headers), so repeating a request for the same range within
+    the TTL (e.g. on a warm Lambda invocation) costs no network round trip
+    and no rate-limit budget.
     """
     
-    def __init__(self, config: APIConfig):
+    # Seconds a cached response stays valid, and the maximum cached responses
+    response_cache_ttl = 15 * 60
+    response_cache_size = 64
+    
+    # Maximum mock generators kept, one per requested date range
+    mock_cache_size = 4
+    
+    def __init__(self, config: APIConfig, session: Optional[requests.Session] = None):
         """
         Initialize the external data collector.
         
         Args:
             config: API configuration parameters
+            session: Shared HTTP session; one is created on first use when omitted
         """
         self.config = config
-        self.rate_limiter = RateLimiter(
+        self.rate_limiter = get_rate_limiter(
+            self._api_host(),
             config.max_requests_per_minute,
             config.max_requests_per_hour
         )
         
-        # Configure HTTP session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=config.max_retries,
-            backoff_factor=config.backoff_factor,
-            status_forcelist=config.retry_status_codes,
-            allowed_methods=["GET", "POST"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # HTTP session with pooled keep-alive connections (see the session property)
+        self._session = session
         
-        # Initialize mock data generator for fallback
+        # Cache of (expires_at, response) keyed on the request, oldest first
+        self._response_cache = OrderedDict()
+        
+        # Mock data generators for fallback keyed on (start_date, end_date),
+        # oldest first; mock_generator is the one used most recently
+        self._mock_generators = OrderedDict()
         self.mock_generator = None
     
+    def _api_host(self) -> str:
+        """Host whose rate limits this collector is subject to."""
+        return ''
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session used for API requests.
+        
+        Created lazily so collectors that only ever fall back to mock data
+        never pay for building a session and its adapters.
+        """
+        if self._session is None:
+            self._session = create_http_session(self.config)
+        return self._session
+    
+    def _get_cached_response(self, cache_key: Tuple) -> Optional[requests.Response]:
+        """Return a still-valid cached response for cache_key, if any."""
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        expires_at, response = cached
+        if time.monotonic() >= expires_at:
+            del self._response_cache[cache_key]
+            return None
+        
+        self._response_cache.move_to_end(cache_key)
+        return response
+    
+    def _cache_response(self, cache_key: Tuple, response: requests.Response) -> None:
+        """Store a successful response, evicting the least recently used one."""
+        self._response_cache[cache_key] = (time.monotonic() + self.response_cache_ttl, response)
+        if len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+    
     def _make_request(self, url: str, headers: Dict[str, str] = None, 
                      params: Dict[str, Any] = None) -> Optional[requests.Response]:
         """
@@ -230,26 +444,144 @@ class ExternalDataCollector:
         Returns:
             Response object or None if request failed
         """
-        self.rate_limiter.wait_if_needed()
+        headers = headers or {}
+        params = params or {}
         
-        try:
-            response = self.session.get(
+        cache_key = (url, tuple(sorted(params.items())), tuple(sorted(headers.items())))
+        return self._send_with_retries(
+            lambda: self.session.get(
                 url,
-                headers=headers or {},
-                params=params or {},
+                headers=headers,
+                params=params,
                 timeout=self.config.request_timeout
-            )
-            response.raise_for_status()
+            ),
+            cache_key
+        )
+    
+    def _retry_delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed request.
+        
+        A numeric Retry-After header (sent with 429/503) is honored up to
+        MAX_BACKOFF_SECONDS, so a misbehaving server cannot stall the run;
+        otherwise capped exponential backoff with jitter is used.
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                try:
+                    return min(MAX_BACKOFF_SECONDS, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass  # HTTP-date form; fall back to backoff
+        return compute_backoff(self.config.backoff_factor, attempt)
+    
+    def _send_with_retries(self, send: Callable[[], requests.Response],
+                           cache_key: Tuple) -> Optional[requests.Response]:
+        """
+        Send a request with response caching, rate limiting and retries.
+        
+        Connection errors, timeouts and config.retry_status_codes responses are
+        retried up to config.max_retries times. Every attempt, retries included,
+        goes through the rate limiter, so time spent honoring Retry-After is
+        reflected in its sliding windows.
+        
+        Args:
+            send: Callable performing one HTTP attempt
+            cache_key: Key for the response cache
+            
+        Returns:
+            Response object or None if request failed
+        """
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
+        max_retries = self.config.max_retries
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.wait_if_needed()
+            
+            try:
+                response = send()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == max_retries:
+                    logger.error("Request failed: %s", e)
+                    return None
+                sleep_time = self._retry_delay(None, attempt)
+                logger.warning("Request error (%s), retrying in %.2f seconds", e, sleep_time)
+                time.sleep(sleep_time)
+                continue
+            except requests.exceptions.RequestException as e:
+                logger.error("Request failed: %s", e)
+                return None
+            
+            if response.status_code in self.config.retry_status_codes and attempt < max_retries:
+                sleep_time = self._retry_delay(response, attempt)
+                logger.warning("HTTP %s, retrying in %.2f seconds", response.status_code, sleep_time)
+                time.sleep(sleep_time)
+                continue
+            
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                logger.error("Request failed: %s", e)
+                return None
+            
+            self._cache_response(cache_key, response)
             return response
+        
+        return None
+    
+    def _prepare_template(self, url: str, headers: Dict[str, str]) -> Tuple[requests.PreparedRequest, Dict[str, Any]]:
+        """
+        Prepare a reusable GET request for an endpoint hit repeatedly.
+        
+        Session headers and environment settings (proxies, CA bundle) are
+        merged once here instead of on every call.
+        
+        Args:
+            url: Endpoint URL without query parameters
+            headers: Request headers
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return None
+        Returns:
+            Tuple of (prepared request template, keyword arguments for session.send)
+        """
+        template = self.session.prepare_request(requests.Request('GET', url, headers=headers))
+        send_kwargs = self.session.merge_environment_settings(template.url, {}, None, None, None)
+        send_kwargs['timeout'] = self.config.request_timeout
+        return template, send_kwargs
+    
+    def _send_prepared(self, template: Tuple[requests.PreparedRequest, Dict[str, Any]],
+                       params: Dict[str, Any]) -> Optional[requests.Response]:
+        """
+        Make a rate-limited request from a prepared template with new parameters.
+        
+        Behaves like _make_request (caching, rate limiting, error handling) but
+        only the query string is rebuilt per call.
+        
+        Args:
+            template: Result of _prepare_template
+            params: Request parameters for this call
+            
+        Returns:
+            Response object or None if request failed
+        """
+        prepared_template, send_kwargs = template
+        prepared = prepared_template.copy()
+        prepared.prepare_url(prepared_template.url, params)
+        
+        cache_key = (prepared.url, tuple(sorted(prepared.headers.items())))
+        return self._send_with_retries(
+            lambda: self.session.send(prepared, **send_kwargs),
+            cache_key
+        )
     
     def _get_mock_generator(self, start_date: datetime, end_date: datetime) -> MockDataGenerator:
         """
         Get or create mock data generator for fallback.
         
+        Generators are cached per date range, so a repeated range reuses its
+        generator while a new range never gets data generated for another one.
+        
         Args:
             start_date: Start date for mock data
             end_date: End date for mock data
@@ -257,10 +589,19 @@ class ExternalDataCollector:
         Returns:
             MockDataGenerator instance
         """
-        if self.mock_generator is None:
+        key = (start_date, end_date)
+        generator = self._mock_generators.get(key)
+        if generator is None:
             config = create_default_config(start_date, end_date)
-            self.mock_generator = MockDataGenerator(config)
-        return self.mock_generator
+            generator = MockDataGenerator(config)
+            self._mock_generators[key] = generator
+            if len(self._mock_generators) > self.mock_cache_size:
+                self._mock_generators.popitem(last=False)
+        else:
+            self._mock_generators.move_to_end(key)
+        
+        self.mock_generator = generator
+        return generator
 
 
 class DominosAPIClient(ExternalDataCollector):
@@ -268,6 +609,32 @@ class DominosAPIClient(ExternalDataCollector):
     Client for collecting Domino's pizza order data from external APIs.
     """
     
+    def __init__(self, config: APIConfig, session: Optional[requests.Session] = None):
+        """
+        Initialize the Domino's client.
+        
+        Args:
+            config: API configuration parameters
+            session: Shared HTTP session; a new one is created when omitted
+        """
+        super().__init__(config, session)
+        
+        self._has_credentials = has_dominos_credentials(config)
+        
+        # API request headers, built once since the credentials are fixed
+        self._headers = {
+            'Authorization': f'Bearer {config.dominos_api_key}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        } if config.dominos_api_key else None
+        
+        # Prepared orders request, built on first use (see _prepare_template)
+        self._orders_template = None
+    
+    def _api_host(self) -> str:
+        """Host of the Domino's API."""
+        return urlsplit(self.config.dominos_api_url).netloc
+    
     def collect_dominos_data(self, start_date: datetime, end_date: datetime) -> List[DominosOrder]:
         """
         Collect Domino's order data from external API with fallback to mock data.
@@ -279,24 +646,24 @@ class DominosAPIClient(ExternalDataCollector):
         Returns:
             List of DominosOrder objects
         """
-        logger.info(f"Collecting Domino's data from {start_date} to {end_date}")
+        logger.info("Collecting Domino's data from %s to %s", start_date, end_date)
         
         # Check if API credentials are available
-        if not self.config.dominos_api_key or not self.config.dominos_store_id:
+        if not self._has_credentials:
             logger.warning("Domino's API credentials not available, using mock data")
             return self._fallback_to_mock_orders(start_date, end_date)
         
         try:
             orders = self._fetch_real_orders(start_date, end_date)
             if orders:
-                logger.info(f"Successfully collected {len(orders)} real Domino's orders")
+                logger.info("Successfully collected %d real Domino's orders", len(orders))
                 return orders
             else:
                 logger.warning("No real orders retrieved, falling back to mock data")
                 return self._fallback_to_mock_orders(start_date, end_date)
                 
         except Exception as e:
-            logger.error(f"Failed to collect real Domino's data: {e}")
+            logger.error("Failed to collect real Domino's data: %s", e)
             return self._fallback_to_mock_orders(start_date, end_date)
     
     def _fetch_real_orders(self, start_date: datetime, end_date: datetime) -> List[DominosOrder]:
@@ -312,40 +679,42 @@ class DominosAPIClient(ExternalDataCollector):
         """
         orders = []
         
-        # Prepare API request headers
-        headers = {
-            'Authorization': f'Bearer {self.config.dominos_api_key}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        # Prepared once per client; each window only rebuilds the query string
+        if self._orders_template is None:
+            self._orders_template = self._prepare_template(
+                f"{self.config.dominos_api_url}/orders", self._headers
+            )
         
-        # Iterate through date range (API might have daily limits)
-        current_date = start_date
-        while current_date <= end_date:
-            next_date = min(current_date + timedelta(days=1), end_date)
+        # One request per query window (a single request for typical ranges)
+        # rather than one per day
+        window_start = start_date
+        while True:
+            window_end = min(window_start + DOMINOS_QUERY_WINDOW, end_date)
             
             # Prepare request parameters
             params = {
                 'store_id': self.config.dominos_store_id,
-                'start_date': current_date.isoformat(),
-                'end_date': next_date.isoformat(),
+                'start_date': window_start.isoformat(),
+                'end_date': window_end.isoformat(),
                 'include_details': 'true'
             }
             
             # Make API request
-            url = f"{self.config.dominos_api_url}/orders"
-            response = self._make_request(url, headers, params)
+            response = self._send_prepared(self._orders_template, params)
             
             if response:
                 try:
-                    data = response.json()
-                    daily_orders = self._parse_dominos_response(data)
-                    orders.extend(daily_orders)
+                    # The decoded payload is not bound to a name, so it is freed
+                    # as soon as its orders are built rather than staying alive
+                    # while the next window downloads
+                    orders.extend(self._parse_dominos_response(orjson.loads(response.content)))
                     
                 except (json.JSONDecodeError, KeyError) as e:
-                    logger.error(f"Failed to parse Domino's API response: {e}")
+                    logger.error("Failed to parse Domino's API response: %s", e)
             
-            current_date = next_date
+            if window_end >= end_date:
+                break
+            window_start = window_end
         
         return orders
     
@@ -360,18 +729,18 @@ class DominosAPIClient(ExternalDataCollector):
             List of parsed DominosOrder objects
         """
         orders = []
+        append_order = orders.append
         
         # Expected API response structure (this would need to match real Domino's API)
-        for order_data in api_data.get('orders', []):
+        for order_data in api_data.get('orders', ()):
             try:
-                # Parse pizza types from order items
+                # Collect pizza types and total quantity in one pass over the items
                 pizza_types = []
-                for item in order_data.get('items', []):
+                total_quantity = 0
+                for item in order_data.get('items', ()):
                     if item.get('category') == 'pizza':
                         pizza_types.append(item.get('name', 'Unknown Pizza'))
-                
-                # Calculate total quantity
-                total_quantity = sum(item.get('quantity', 1) for item in order_data.get('items', []))
+                    total_quantity += item.get('quantity', 1)
                 
                 order = DominosOrder(
                     order_id=order_data['order_id'],
@@ -383,10 +752,10 @@ class DominosAPIClient(ExternalDataCollector):
                     data_source='real'
                 )
                 
-                orders.append(order)
+                append_order(order)
                 
             except (KeyError, ValueError, TypeError) as e:
-                logger.error(f"Failed to parse order data: {e}")
+                logger.error("Failed to parse order data: %s", e)
                 continue
         
         return orders
@@ -407,7 +776,7 @@ class DominosAPIClient(ExternalDataCollector):
         mock_generator = self._get_mock_generator(start_date, end_date)
         orders = mock_generator.generate_pizza_orders()
         
-        logger.info(f"Generated {len(orders)} mock Domino's orders")
+        logger.info("Generated %d mock Domino's orders", len(orders))
         return orders
 
 
@@ -416,6 +785,32 @@ class FootballAPIClient(ExternalDataCollector):
     Client for collecting football match data from external APIs.
     """
     
+    # Only FINISHED matches are requested and those never change; the TTL
+    # only bounds how late newly finished matches show up
+    response_cache_ttl = 60 * 60
+    
+    def __init__(self, config: APIConfig, session: Optional[requests.Session] = None):
+        """
+        Initialize the football client.
+        
+        Args:
+            config: API configuration parameters
+            session: Shared HTTP session; a new one is created when omitted
+        """
+        super().__init__(config, session)
+        
+        self._has_credentials = has_football_credentials(config)
+        
+        # API request headers, built once since the credentials are fixed
+        self._headers = {
+            'X-Auth-Token': config.football_api_key,
+            'Content-Type': 'application/json'
+        } if config.football_api_key else None
+    
+    def _api_host(self) -> str:
+        """Host of the football API."""
+        return urlsplit(self.config.football_api_url).netloc
+    
     def collect_football_data(self, start_date: datetime, end_date: datetime) -> List[FootballMatch]:
         """
         Collect football match data from external API with fallback to mock data.
@@ -427,24 +822,24 @@ class FootballAPIClient(ExternalDataCollector):
         Returns:
             List of FootballMatch objects
         """
-        logger.info(f"Collecting football data from {start_date} to {end_date}")
+        logger.info("Collecting football data from %s to %s", start_date, end_date)
         
         # Check if API credentials are available
-        if not self.config.football_api_key:
+        if not self._has_credentials:
             logger.warning("Football API credentials not available, using mock data")
             return self._fallback_to_mock_matches(start_date, end_date)
         
         try:
             matches = self._fetch_real_matches(start_date, end_date)
             if matches:
-                logger.info(f"Successfully collected {len(matches)} real football matches")
+                logger.info("Successfully collected %d real football matches", len(matches))
                 return matches
             else:
                 logger.warning("No real matches retrieved, falling back to mock data")
                 return self._fallback_to_mock_matches(start_date, end_date)
                 
         except Exception as e:
-            logger.error(f"Failed to collect real football data: {e}")
+            logger.error("Failed to collect real football data: %s", e)
             return self._fallback_to_mock_matches(start_date, end_date)
     
     def _fetch_real_matches(self, start_date: datetime, end_date: datetime) -> List[FootballMatch]:
@@ -460,12 +855,6 @@ class FootballAPIClient(ExternalDataCollector):
         """
         matches = []
         
-        # Prepare API request headers
-        headers = {
-            'X-Auth-Token': self.config.football_api_key,
-            'Content-Type': 'application/json'
-        }
-        
         # Get matches from Premier League (competition ID 2021 in football-data.org API)
         params = {
             'dateFrom': start_date.strftime('%Y-%m-%d'),
@@ -475,15 +864,15 @@ class FootballAPIClient(ExternalDataCollector):
         
         # Make API request
         url = f"{self.config.football_api_url}/competitions/2021/matches"
-        response = self._make_request(url, headers, params)
+        response = self._make_request(url, self._headers, params)
         
         if response:
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
                 matches = self._parse_football_response(data)
                 
             except (json.JSONDecodeError, KeyError) as e:
-                logger.error(f"Failed to parse football API response: {e}")
+                logger.error("Failed to parse football API response: %s", e)
         
         return matches
     
@@ -498,49 +887,41 @@ class FootballAPIClient(ExternalDataCollector):
             List of parsed FootballMatch objects
         """
         matches = []
+        append_match = matches.append
         
         # Expected API response structure (football-data.org format)
-        for match_data in api_data.get('matches', []):
+        for match_data in api_data.get('matches', ()):
             try:
                 # Parse match details
-                home_team = match_data['homeTeam']['name']
-                away_team = match_data['awayTeam']['name']
                 home_score = match_data['score']['fullTime']['home']
                 away_score = match_data['score']['fullTime']['away']
                 
-                # Determine event type based on scores
-                if home_score > away_score:
-                    event_type = 'win'
-                elif away_score > home_score:
-                    event_type = 'loss'
-                else:
-                    event_type = 'draw'
-                
-                # Determine match significance
-                competition_stage = match_data.get('stage', 'REGULAR_SEASON')
-                if 'FINAL' in competition_stage:
+                # Event type is a table lookup and significance a set
+                # membership test rather than substring scans
+                event_type = _EVENT_TYPE_BY_SIGN[(home_score > away_score) - (home_score < away_score)]
+                stage = match_data.get('stage', 'REGULAR_SEASON')
+                if stage in _FINAL_STAGES:
                     match_significance = 'final'
-                elif competition_stage != 'REGULAR_SEASON':
-                    match_significance = 'tournament'
-                else:
+                elif stage == 'REGULAR_SEASON':
                     match_significance = 'regular'
+                else:
+                    match_significance = 'tournament'
                 
-                match = FootballMatch(
+                append_match(FootballMatch(
                     match_id=str(match_data['id']),
-                    timestamp=datetime.fromisoformat(match_data['utcDate'].replace('Z', '+00:00')),
-                    home_team=home_team,
-                    away_team=away_team,
+                    # fromisoformat accepts the trailing 'Z' directly on Python 3.11+
+                    timestamp=datetime.fromisoformat(match_data['utcDate']),
+                    home_team=match_data['homeTeam']['name'],
+                    away_team=match_data['awayTeam']['name'],
                     home_score=home_score,
                     away_score=away_score,
                     event_type=event_type,
                     match_significance=match_significance,
                     data_source='real'
-                )
-                
-                matches.append(match)
+                ))
                 
             except (KeyError, ValueError, TypeError) as e:
-                logger.error(f"Failed to parse match data: {e}")
+                logger.error("Failed to parse match data: %s", e)
                 continue
         
         return matches
@@ -561,7 +942,7 @@ class FootballAPIClient(ExternalDataCollector):
         mock_generator = self._get_mock_generator(start_date, end_date)
         matches = mock_generator.generate_football_matches()
         
-        logger.info(f"Generated {len(matches)} mock football matches")
+        logger.info("Generated %d mock football matches", len(matches))
         return matches
 
 
@@ -578,8 +959,15 @@ class DataCollectionSystem:
             config: API configuration parameters
         """
         self.config = config
-        self.dominos_client = DominosAPIClient(config)
-        self.football_client = FootballAPIClient(config)
+        
+        # Both clients share one session and its connection pools; it is only
+        # built when at least one of them can reach a real API
+        if has_dominos_credentials(config) or has_football_credentials(config):
+            self.session = create_http_session(config)
+        else:
+            self.session = None
+        self.dominos_client = DominosAPIClient(config, self.session)
+        self.football_client = FootballAPIClient(config, self.session)
     
     def collect_all_data(self, start_date: datetime, end_date: datetime) -> Tuple[List[DominosOrder], List[FootballMatch]]:
         """
@@ -592,24 +980,37 @@ class DataCollectionSystem:
         Returns:
             Tuple of (pizza_orders, football_matches)
         """
-        logger.info(f"Starting data collection from {start_date} to {end_date}")
+        logger.info("Starting data collection from %s to %s", start_date, end_date)
         
-        # Collect pizza orders
-        pizza_orders = self.dominos_client.collect_dominos_data(start_date, end_date)
-        
-        # Collect football matches
-        football_matches = self.football_client.collect_football_data(start_date, end_date)
+        # The two sources are independent and I/O-bound, so collect them
+        # concurrently; each client has its own rate limiter and the shared
+        # session's connection pools are thread-safe
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Collect pizza orders
+            orders_future = executor.submit(
+                self.dominos_client.collect_dominos_data, start_date, end_date
+            )
+            
+            # Collect football matches
+            matches_future = executor.submit(
+                self.football_client.collect_football_data, start_date, end_date
+            )
+            
+            pizza_orders = orders_future.result()
+            football_matches = matches_future.result()
         
-        logger.info(f"Data collection complete: {len(pizza_orders)} orders, {len(football_matches)} matches")
+        logger.info("Data collection complete: %d orders, %d matches", len(pizza_orders), len(football_matches))
         
         return pizza_orders, football_matches
     
-    def handle_api_errors(self, response: requests.Response) -> bool:
+    def handle_api_errors(self, response: requests.Response, attempt: int = 0) -> bool:
         """
         Handle API errors and determine if retry is appropriate.
         
         Args:
             response: HTTP response object
+            attempt: Zero-based number of retries already made for this request;
+                     server-error backoff doubles with each attempt
             
         Returns:
             True if retry is recommended, False otherwise
@@ -618,14 +1019,14 @@ class DataCollectionSystem:
             retry_after = response.headers.get('Retry-After')
             if retry_after:
                 sleep_time = int(retry_after)
-                logger.warning(f"Rate limit exceeded, waiting {sleep_time} seconds")
+                logger.warning("Rate limit exceeded, waiting %s seconds", sleep_time)
                 time.sleep(sleep_time)
                 return True
         
         elif response.status_code in [500, 502, 503, 504]:  # Server errors
-            # Exponential backoff for server errors
-            sleep_time = self.config.backoff_factor * (2 ** random.randint(0, 3))
-            logger.warning(f"Server error {response.status_code}, waiting {sleep_time} seconds")
+            # Capped exponential backoff on the attempt number, plus jitter
+            sleep_time = compute_backoff(self.config.backoff_factor, attempt)
+            logger.warning("Server error %s, waiting %.2f seconds", response.status_code, sleep_time)
             time.sleep(sleep_time)
             return True
         
@@ -638,7 +1039,7 @@ class DataCollectionSystem:
             return False
         
         else:
-            logger.error(f"Unhandled API error: {response.status_code}")
+            logger.error("Unhandled API error: %s", response.status_code)
             return False
 
 
@@ -676,22 +1077,22 @@ def create_api_config_from_env() -> APIConfig:
         
         return APIConfig(
             # Domino's API configuration
-            dominos_api_url=DOMINOS_API_CONFIG['base_url'],
-            dominos_api_key=DOMINOS_API_CONFIG['api_key'] or None,
-            dominos_store_id=DOMINOS_API_CONFIG.get('store_id') or None,
+            dominos_api_url=DOMINOS_API_CONFIG.base_url,
+            dominos_api_key=DOMINOS_API_CONFIG.api_key or None,
+            dominos_store_id=DOMINOS_API_CONFIG.store_id or None,
             
             # Football API configuration
-            football_api_url=FOOTBALL_API_CONFIG['base_url'],
-            football_api_key=FOOTBALL_API_CONFIG['api_key'] or None,
+            football_api_url=FOOTBALL_API_CONFIG.base_url,
+            football_api_key=FOOTBALL_API_CONFIG.api_key or None,
             
             # Rate limiting configuration
-            max_requests_per_minute=RATE_LIMIT_CONFIG['max_requests_per_minute'],
-            max_requests_per_hour=RATE_LIMIT_CONFIG['max_requests_per_hour'],
-            max_retries=RATE_LIMIT_CONFIG['max_retries'],
-            backoff_factor=RATE_LIMIT_CONFIG['backoff_factor'],
+            max_requests_per_minute=RATE_LIMIT_CONFIG.max_requests_per_minute,
+            max_requests_per_hour=RATE_LIMIT_CONFIG.max_requests_per_hour,
+            max_retries=RATE_LIMIT_CONFIG.max_retries,
+            backoff_factor=RATE_LIMIT_CONFIG.backoff_factor,
             
             # Timeout configuration
-            request_timeout=DOMINOS_API_CONFIG['timeout']
+            request_timeout=DOMINOS_API_CONFIG.timeout
         )
         
     except ImportError:
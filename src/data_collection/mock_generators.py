@@ -7,17 +7,26 @@ correlations for analysis.
 """
 
 import random
-import uuid
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
 import math
+from bisect import bisect
+from itertools import accumulate, compress
 
 from ..models.pizza_order import DominosOrder
 from ..models.football_match import FootballMatch
 
 
-@dataclass
+def _selections_by_mask(names: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Map every bitmask over names (bit i = names[i]) to the names it selects."""
+    return tuple(
+        tuple(name for i, name in enumerate(names) if mask >> i & 1)
+        for mask in range(1 << len(names))
+    )
+
+
+@dataclass(slots=True)
 class GeneratorConfig:
     """Configuration parameters for mock data generation."""
     
@@ -75,6 +84,39 @@ class MockDataGenerator:
         ("Seafood Special", 0.02)
     ]
     
+    # PIZZA_TYPES split into parallel tuples for sampling with cum_weights
+    _PIZZA_NAMES = tuple(pizza for pizza, _ in PIZZA_TYPES)
+    _PIZZA_CUM_WEIGHTS = tuple(accumulate(weight for _, weight in PIZZA_TYPES))
+    
+    # Pizza i is drawn as the bit 1 << i; OR-ing an order's draws gives a mask
+    # that deduplicates them and indexes the selection it stands for
+    _PIZZA_BITS = tuple(1 << i for i in range(len(PIZZA_TYPES)))
+    _PIZZA_SELECTION_BY_MASK = _selections_by_mask(_PIZZA_NAMES)
+    
+    # Order weight of each hour of the day: lunch (11-14) and dinner (17-21)
+    # peaks, low activity mornings/afternoon/late evening, very low at night
+    ORDER_HOUR_WEIGHTS = (
+        0.005, 0.005, 0.005, 0.005, 0.005, 0.005,  # 00-05
+        0.02, 0.02, 0.02, 0.02, 0.02,              # 06-10
+        0.05, 0.12, 0.15, 0.08,                    # 11-14 lunch peak
+        0.02, 0.02,                                # 15-16
+        0.08, 0.15, 0.20, 0.12, 0.05,              # 17-21 dinner peak
+        0.02, 0.02                                 # 22-23
+    )
+    _ORDER_HOURS = tuple(range(24))
+    _ORDER_HOUR_CUM_WEIGHTS = tuple(accumulate(ORDER_HOUR_WEIGHTS))
+    
+    # Order quantity distribution
+    _QUANTITIES = (1, 2, 3, 4, 5)
+    _QUANTITY_CUM_WEIGHTS = tuple(accumulate((0.5, 0.25, 0.15, 0.07, 0.03)))
+    
+    # Time shifts of extra orders on high-activity days (within 30 minutes)
+    _EXTRA_ORDER_OFFSETS = tuple(timedelta(minutes=minutes) for minutes in range(-30, 31))
+    
+    # Number of distinct pizzas drawn per order
+    _PIZZA_COUNTS = (1, 2, 3, 4)
+    _PIZZA_COUNT_CUM_WEIGHTS = tuple(accumulate((0.6, 0.25, 0.12, 0.03)))
+    
     # Premier League teams for realistic match generation
     FOOTBALL_TEAMS = [
         "Manchester United", "Manchester City", "Liverpool", "Chelsea",
@@ -84,6 +126,16 @@ class MockDataGenerator:
         "Southampton", "Bournemouth"
     ]
     
+    # Common football score patterns as (home, away, weight)
+    SCORE_PATTERNS = [
+        (0, 0, 0.08), (1, 0, 0.12), (0, 1, 0.12), (1, 1, 0.15),
+        (2, 0, 0.10), (0, 2, 0.10), (2, 1, 0.12), (1, 2, 0.12),
+        (3, 0, 0.05), (0, 3, 0.05), (2, 2, 0.06), (3, 1, 0.04),
+        (1, 3, 0.04), (3, 2, 0.02), (2, 3, 0.02), (4, 0, 0.01)
+    ]
+    _SCORES = tuple((home, away) for home, away, _ in SCORE_PATTERNS)
+    _SCORE_CUM_WEIGHTS = tuple(accumulate(weight for _, _, weight in SCORE_PATTERNS))
+    
     def __init__(self, config: GeneratorConfig):
         """
         Initialize the mock data generator with configuration.
@@ -94,15 +146,31 @@ class MockDataGenerator:
         self.config = config
         self.random = random.Random(42)  # Fixed seed for reproducible results
         
+        # Zero-padded per-day order numbers ('0001', '0002', ...), grown on demand
+        self._order_numbers: List[str] = []
+        
+        # Locations frozen at construction for sampling; later edits to
+        # config.locations do not affect this generator
+        self._locations = tuple(config.locations)
+        
+        # Order volume multiplier caused by each (event_type, match_significance)
+        self._effect_by_outcome = self._build_effect_table()
+        
     def generate_pizza_orders(self, 
                             num_days: Optional[int] = None,
-                            base_volume: Optional[int] = None) -> List[DominosOrder]:
+                            base_volume: Optional[int] = None,
+                            match_effects: Optional[Dict[date, float]] = None) -> List[DominosOrder]:
         """
         Generate realistic Domino's pizza orders with statistical distributions.
         
+        When match_effects is given, orders are correlated with the matches as
+        they are generated, with the same acceptance rules as
+        correlate_data_timing, so rejected orders are never built.
+        
         Args:
             num_days: Number of days to generate data for (overrides config date range)
             base_volume: Base orders per day (overrides config)
+            match_effects: Match date to effect multiplier (see _calculate_match_effects)
             
         Returns:
             List of DominosOrder objects with realistic patterns
@@ -117,18 +185,26 @@ class MockDataGenerator:
         else:
             daily_base = self.config.base_orders_per_day
             
+        # Days are generated sequentially in one process: each day is already
+        # a handful of batched draws, and shipping DominosOrder objects back
+        # from worker processes costs more than generating them
         orders = []
+        extend_orders = orders.extend
         current_date = self.config.start_date
+        one_day = timedelta(days=1)
         
         while current_date < end_date:
             # Calculate daily order volume with realistic patterns
             daily_orders = self._calculate_daily_order_volume(current_date, daily_base)
             
             # Generate orders for this day
-            day_orders = self._generate_orders_for_day(current_date, daily_orders)
-            orders.extend(day_orders)
+            if match_effects:
+                effect_multiplier = self._day_effect(match_effects, current_date.date())
+            else:
+                effect_multiplier = None
+            extend_orders(self._generate_orders_for_day(current_date, daily_orders, effect_multiplier))
             
-            current_date += timedelta(days=1)
+            current_date += one_day
             
         return orders
     
@@ -152,20 +228,43 @@ class MockDataGenerator:
             
         matches = []
         current_date = self.config.start_date
+        total_days = (self.config.end_date - self.config.start_date).days
         
-        for i in range(total_matches):
-            # Spread matches across the date range
-            days_offset = (i / total_matches) * (self.config.end_date - self.config.start_date).days
-            match_date = current_date + timedelta(days=days_offset)
-            
-            # Adjust to realistic match times (weekends, evenings)
-            match_date = self._adjust_to_realistic_match_time(match_date)
-            
-            match = self._generate_single_match(match_date, f"MATCH_{i+1:04d}")
-            matches.append(match)
+        # Spread matches across the date range, adjusted to realistic match
+        # times (weekends, evenings)
+        match_dates = [
+            self._adjust_to_realistic_match_time(
+                current_date + timedelta(days=(i / total_matches) * total_days)
+            )
+            for i in range(total_matches)
+        ]
+        
+        # Draw teams, scores and significance for every match in batched calls.
+        # Away teams are drawn from the other len-1 teams by skipping the home
+        # index, so the two sides always differ without resampling
+        rng = self.random
+        num_teams = len(self.FOOTBALL_TEAMS)
+        home_indices = rng.choices(range(num_teams), k=total_matches)
+        away_indices = rng.choices(range(num_teams - 1), k=total_matches)
+        scores = rng.choices(self._SCORES, cum_weights=self._SCORE_CUM_WEIGHTS, k=total_matches)
+        significance_rolls = [rng.random() for _ in range(total_matches)]
+        
+        # Build matches in timestamp order. Weekend adjustment only moves
+        # dates forward a few days, so the indices are nearly sorted already
+        # and the stable sort on the date list keeps ties in draw order
+        for i in sorted(range(total_matches), key=match_dates.__getitem__):
+            home_index = home_indices[i]
+            away_index = away_indices[i]
+            if away_index >= home_index:
+                away_index += 1
             
-        # Sort matches by timestamp
-        matches.sort(key=lambda m: m.timestamp)
+            home_score, away_score = scores[i]
+            matches.append(self._build_match(
+                match_dates[i], f"MATCH_{i+1:04d}",
+                self.FOOTBALL_TEAMS[home_index], self.FOOTBALL_TEAMS[away_index],
+                home_score, away_score, significance_rolls[i]
+            ))
+        
         return matches
     
     def correlate_data_timing(self, 
@@ -184,58 +283,93 @@ class MockDataGenerator:
         if not matches:
             return orders, matches
             
-        # Create a map of match dates to match outcomes
-        match_effects = {}
-        for match in matches:
-            match_date = match.timestamp.date()
-            
-            # Determine the effect this match should have on orders
-            effect_multiplier = 1.0
-            
-            if match.event_type == 'win':
-                effect_multiplier = self.config.post_win_multiplier
-            elif match.event_type == 'draw':
-                effect_multiplier = 1.3  # Moderate increase for draws
-            else:  # loss
-                effect_multiplier = 0.8  # Slight decrease for losses
-                
-            # Tournament and final matches have stronger effects
-            if match.match_significance == 'final':
-                effect_multiplier *= 1.5
-            elif match.match_significance == 'tournament':
-                effect_multiplier *= 1.2
-                
-            match_effects[match_date] = effect_multiplier
+        match_effects = self._calculate_match_effects(matches)
         
-        # Adjust order volumes based on match effects
+        # Adjust order volumes based on match effects. Orders arrive in runs
+        # sharing a date, so each date's combined multiplier is resolved once
+        # and reused while timestamps stay inside that day, without building
+        # a date object per order
+        day_effects = {}
+        rng_random = self.random.random
         aligned_orders = []
+        append_order = aligned_orders.append
+        has_extra = []
+        append_has_extra = has_extra.append
+        one_day = timedelta(days=1)
+        day_start = day_end = day_tzinfo = None
+        effect_multiplier = 1.0
+        
         for order in orders:
-            order_date = order.timestamp.date()
-            
-            # Check for match effects on this date and the day after
-            effect_multiplier = 1.0
-            
-            # Same day effect (during/after match)
-            if order_date in match_effects:
-                effect_multiplier = match_effects[order_date]
-            
-            # Next day effect (celebration/disappointment orders)
-            prev_date = order_date - timedelta(days=1)
-            if prev_date in match_effects:
-                next_day_effect = match_effects[prev_date] * 0.6  # Reduced effect next day
-                effect_multiplier = max(effect_multiplier, next_day_effect)
+            timestamp = order.timestamp
+            if (day_start is None or timestamp.tzinfo is not day_tzinfo
+                    or not day_start <= timestamp < day_end):
+                order_date = timestamp.date()
+                effect_multiplier = day_effects.get(order_date)
+                if effect_multiplier is None:
+                    effect_multiplier = self._day_effect(match_effects, order_date)
+                    day_effects[order_date] = effect_multiplier
+                
+                day_tzinfo = timestamp.tzinfo
+                day_start = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+                day_end = day_start + one_day
             
             # Randomly decide whether to include this order based on effect
-            if self.random.random() < effect_multiplier:
-                aligned_orders.append(order)
+            if rng_random() < effect_multiplier:
+                append_order(order)
                 
                 # For high-effect periods, potentially add extra orders
-                if effect_multiplier > 1.5 and self.random.random() < 0.3:
-                    # Create additional order with slight time variation
-                    extra_order = self._create_similar_order(order)
-                    aligned_orders.append(extra_order)
+                append_has_extra(effect_multiplier > 1.5 and rng_random() < 0.3)
         
-        return aligned_orders, matches
+        return self._insert_similar_orders(aligned_orders, has_extra), matches
+    
+    def _calculate_match_effects(self, matches: List[FootballMatch]) -> Dict[date, float]:
+        """
+        Map each match date to the order volume multiplier its result causes.
+        
+        Args:
+            matches: List of football matches
+            
+        Returns:
+            Dictionary of match date to effect multiplier
+        """
+        effect_by_outcome = self._effect_by_outcome
+        return {
+            match.timestamp.date(): effect_by_outcome[match.event_type, match.match_significance]
+            for match in matches
+        }
+    
+    def _build_effect_table(self) -> Dict[Tuple[str, str], float]:
+        """Precompute the order effect of every match outcome and significance."""
+        # Wins use the configured multiplier, draws a moderate increase and
+        # losses (and any other event) a slight decrease
+        event_effects = {
+            'win': self.config.post_win_multiplier,
+            'draw': 1.3,
+            'loss': 0.8,
+            'goal': 0.8,
+        }
+        # Tournament and final matches have stronger effects
+        significance_effects = {'final': 1.5, 'tournament': 1.2, 'regular': 1.0}
+        
+        return {
+            (event_type, significance): event_effect * significance_effect
+            for event_type, event_effect in event_effects.items()
+            for significance, significance_effect in significance_effects.items()
+        }
+    
+    @staticmethod
+    def _day_effect(match_effects: Dict[date, float], order_date: date) -> float:
+        """Combine the same-day and previous-day match effects for order_date."""
+        # Same day effect (during/after match)
+        effect_multiplier = match_effects.get(order_date, 1.0)
+        
+        # Next day effect (celebration/disappointment orders)
+        prev_effect = match_effects.get(order_date - timedelta(days=1))
+        if prev_effect is not None:
+            next_day_effect = prev_effect * 0.6  # Reduced effect next day
+            effect_multiplier = max(effect_multiplier, next_day_effect)
+        
+        return effect_multiplier
     
     def _calculate_daily_order_volume(self, date: datetime, base_volume: int) -> int:
         """Calculate realistic daily order volume with patterns."""
@@ -251,78 +385,165 @@ class MockDataGenerator:
         
         return volume
     
-    def _generate_orders_for_day(self, date: datetime, num_orders: int) -> List[DominosOrder]:
-        """Generate orders for a specific day with realistic timing patterns."""
-        orders = []
+    def _generate_orders_for_day(self, date: datetime, num_orders: int,
+                                 effect_multiplier: Optional[float] = None) -> List[DominosOrder]:
+        """
+        Generate orders for a specific day with realistic timing patterns.
         
-        for i in range(num_orders):
-            # Generate realistic order time (peak hours: 12-14, 18-22)
-            hour = self._generate_realistic_order_hour()
-            minute = self.random.randint(0, 59)
-            second = self.random.randint(0, 59)
-            
-            order_time = date.replace(hour=hour, minute=minute, second=second)
-            
-            # Generate order details
-            order = DominosOrder(
-                order_id=f"DOM_{date.strftime('%Y%m%d')}_{i+1:04d}",
-                timestamp=order_time,
-                location=self.random.choice(self.config.locations),
-                order_total=self._generate_realistic_order_total(),
-                pizza_types=self._generate_pizza_selection(),
-                quantity=self._generate_order_quantity(),
+        Every per-order attribute is drawn for the whole day in one batched
+        random.choices call (k=num_orders) instead of one call per order.
+        With an effect_multiplier, each order is kept with that probability
+        (plus a chance of an extra order on high-effect days) before it is built.
+        """
+        rng = self.random
+        
+        # Generate realistic order times (peak hours: 12-14, 18-22)
+        order_hours = rng.choices(
+            self._ORDER_HOURS, cum_weights=self._ORDER_HOUR_CUM_WEIGHTS, k=num_orders
+        )
+        order_minutes = rng.choices(range(60), k=num_orders)
+        order_seconds = rng.choices(range(60), k=num_orders)
+        
+        # Positional construction is much cheaper than keyword replace();
+        # microsecond and tzinfo carry over from date as replace() would keep them
+        year, month, day = date.year, date.month, date.day
+        microsecond, tzinfo = date.microsecond, date.tzinfo
+        timestamps = [
+            datetime(year, month, day, hour, minute, second, microsecond, tzinfo)
+            for hour, minute, second in zip(order_hours, order_minutes, order_seconds)
+        ]
+        
+        # Generate order details
+        locations = rng.choices(self._locations, k=num_orders)
+        totals = self._generate_order_totals(num_orders)
+        pizza_selections = self._generate_pizza_selections(num_orders)
+        quantities = rng.choices(self._QUANTITIES, cum_weights=self._QUANTITY_CUM_WEIGHTS, k=num_orders)
+        
+        id_prefix = f"DOM_{date.year:04d}{date.month:02d}{date.day:02d}_"
+        order_numbers = self._get_order_numbers(num_orders)
+        
+        def build_order(i: int) -> DominosOrder:
+            return DominosOrder(
+                order_id=id_prefix + order_numbers[i],
+                timestamp=timestamps[i],
+                location=locations[i],
+                order_total=totals[i],
+                pizza_types=pizza_selections[i],
+                quantity=quantities[i],
                 data_source='mock'
             )
-            
-            orders.append(order)
         
+        if effect_multiplier is None:
+            return [build_order(i) for i in range(num_orders)]
+        
+        # Correlate with the day's match effect, building only kept orders
+        rng_random = rng.random
+        orders = [build_order(i) for i in range(num_orders) if rng_random() < effect_multiplier]
+        
+        # For high-effect periods, potentially add extra orders
+        if effect_multiplier > 1.5:
+            has_extra = [rng_random() < 0.3 for _ in orders]
+            return self._insert_similar_orders(orders, has_extra)
         return orders
     
+    def _get_order_numbers(self, count: int) -> List[str]:
+        """Return at least count zero-padded order numbers, starting at '0001'."""
+        order_numbers = self._order_numbers
+        if len(order_numbers) < count:
+            order_numbers.extend(f"{i:04d}" for i in range(len(order_numbers) + 1, count + 1))
+        return order_numbers
+    
+    def _weighted_pick(self, population: Tuple, cum_weights: Tuple[float, ...]):
+        """
+        Pick one item of population by inverse-CDF search of its cumulative weights.
+        
+        Equivalent to random.choices(population, cum_weights=cum_weights)[0]
+        without the per-call overhead of the general k-sample path.
+        """
+        # hi excludes the last index overflow when random() * total rounds up to total
+        return population[bisect(cum_weights, self.random.random() * cum_weights[-1],
+                                 0, len(cum_weights) - 1)]
+    
     def _generate_realistic_order_hour(self) -> int:
         """Generate realistic order hours with peak time distributions."""
-        # Define peak hours with weights
-        hour_weights = {
-            11: 0.05, 12: 0.12, 13: 0.15, 14: 0.08,  # Lunch peak
-            17: 0.08, 18: 0.15, 19: 0.20, 20: 0.12, 21: 0.05  # Dinner peak
-        }
-        
-        # Fill in other hours with low weights
-        for hour in range(24):
-            if hour not in hour_weights:
-                if 6 <= hour <= 10 or 15 <= hour <= 16 or 22 <= hour <= 23:
-                    hour_weights[hour] = 0.02  # Low activity
-                else:
-                    hour_weights[hour] = 0.005  # Very low activity (night)
-        
-        # Weighted random selection
-        hours = list(hour_weights.keys())
-        weights = list(hour_weights.values())
-        return self.random.choices(hours, weights=weights)[0]
+        return self._weighted_pick(self._ORDER_HOURS, self._ORDER_HOUR_CUM_WEIGHTS)
     
     def _generate_realistic_order_total(self) -> float:
         """Generate realistic order totals with proper distribution."""
-        # Log-normal distribution for order totals (realistic for food orders)
-        base_price = self.random.lognormvariate(2.8, 0.4)  # Mean ~£16, std ~£7
-        return round(max(8.99, min(45.99, base_price)), 2)  # Clamp to realistic range
+        return self._generate_order_totals(1)[0]
+    
+    def _generate_order_totals(self, num_orders: int) -> List[float]:
+        """
+        Generate num_orders realistic order totals in one loop.
+        
+        Log-normal distribution for order totals (realistic for food orders),
+        sampled as exp(gauss(mu, sigma)) with the RNG and exp bound locally.
+        """
+        gauss = self.random.gauss
+        exp = math.exp
+        
+        totals = []
+        append_total = totals.append
+        for _ in range(num_orders):
+            base_price = exp(gauss(2.8, 0.4))  # Mean ~£16, std ~£7
+            # Clamp to realistic range
+            if base_price < 8.99:
+                base_price = 8.99
+            elif base_price > 45.99:
+                base_price = 45.99
+            append_total(round(base_price, 2))
+        
+        return totals
     
     def _generate_pizza_selection(self) -> List[str]:
         """Generate realistic pizza type selection."""
-        num_pizzas = self.random.choices([1, 2, 3, 4], weights=[0.6, 0.25, 0.12, 0.03])[0]
-        
-        selected_pizzas = []
-        pizza_types = [pizza for pizza, _ in self.PIZZA_TYPES]
-        weights = [weight for _, weight in self.PIZZA_TYPES]
+        num_pizzas = self._weighted_pick(self._PIZZA_COUNTS, self._PIZZA_COUNT_CUM_WEIGHTS)
+        picks = self.random.choices(
+            self._PIZZA_BITS, cum_weights=self._PIZZA_CUM_WEIGHTS, k=num_pizzas
+        )
         
-        for _ in range(num_pizzas):
-            pizza = self.random.choices(pizza_types, weights=weights)[0]
-            if pizza not in selected_pizzas:  # Avoid duplicates
-                selected_pizzas.append(pizza)
+        # Avoid duplicates by collecting the picks into a bitmask
+        mask = 0
+        for bit in picks:
+            mask |= bit
+        selected_pizzas = list(self._PIZZA_SELECTION_BY_MASK[mask])
         
         return selected_pizzas if selected_pizzas else ["Margherita"]  # Fallback
     
+    def _generate_pizza_selections(self, num_orders: int) -> List[List[str]]:
+        """
+        Generate pizza type selections for num_orders orders at once.
+        
+        Draws the pizza count of every order and then all the pizzas in two
+        batched calls, deduplicating each order's slice with a bitmask as
+        _generate_pizza_selection does.
+        """
+        counts = self.random.choices(
+            self._PIZZA_COUNTS, cum_weights=self._PIZZA_COUNT_CUM_WEIGHTS, k=num_orders
+        )
+        picks = self.random.choices(
+            self._PIZZA_BITS, cum_weights=self._PIZZA_CUM_WEIGHTS, k=sum(counts)
+        )
+        selection_by_mask = self._PIZZA_SELECTION_BY_MASK
+        
+        selections = []
+        position = 0
+        for count in counts:
+            if count == 1:
+                mask = picks[position]
+            else:
+                # OR-ing the picks into a bitmask drops duplicates
+                mask = 0
+                for bit in picks[position:position + count]:
+                    mask |= bit
+            selections.append(list(selection_by_mask[mask]))
+            position += count
+        
+        return selections
+    
     def _generate_order_quantity(self) -> int:
         """Generate realistic order quantities."""
-        return self.random.choices([1, 2, 3, 4, 5], weights=[0.5, 0.25, 0.15, 0.07, 0.03])[0]
+        return self._weighted_pick(self._QUANTITIES, self._QUANTITY_CUM_WEIGHTS)
     
     def _adjust_to_realistic_match_time(self, date: datetime) -> datetime:
         """Adjust match date to realistic match times (weekends, evenings)."""
@@ -348,13 +569,42 @@ class MockDataGenerator:
     
     def _generate_single_match(self, match_date: datetime, match_id: str) -> FootballMatch:
         """Generate a single realistic football match."""
-        # Select teams (ensure they're different)
-        teams = self.random.sample(self.FOOTBALL_TEAMS, 2)
-        home_team, away_team = teams[0], teams[1]
+        # Select teams (ensure they're different): the away team is drawn
+        # from the other len-1 teams by skipping the home index
+        rng_random = self.random.random
+        num_teams = len(self.FOOTBALL_TEAMS)
+        home_index = int(rng_random() * num_teams)
+        away_index = int(rng_random() * (num_teams - 1))
+        away_index += away_index >= home_index
+        home_team, away_team = self.FOOTBALL_TEAMS[home_index], self.FOOTBALL_TEAMS[away_index]
         
         # Generate realistic scores
         home_score, away_score = self._generate_realistic_scores()
         
+        return self._build_match(
+            match_date, match_id, home_team, away_team,
+            home_score, away_score, self.random.random()
+        )
+    
+    def _build_match(self, match_date: datetime, match_id: str,
+                     home_team: str, away_team: str,
+                     home_score: int, away_score: int,
+                     significance_rand: float) -> FootballMatch:
+        """
+        Build a FootballMatch from already drawn teams, scores and significance roll.
+        
+        Args:
+            match_date: Kick-off time
+            match_id: Match identifier
+            home_team: Home team name
+            away_team: Away team name
+            home_score: Home team goals
+            away_score: Away team goals
+            significance_rand: Uniform [0, 1) draw deciding the match significance
+            
+        Returns:
+            FootballMatch with event type and significance derived from the draws
+        """
         # Determine event type based on scores
         if home_score > away_score:
             event_type = 'win'
@@ -364,7 +614,6 @@ class MockDataGenerator:
             event_type = 'draw'
         
         # Determine match significance
-        significance_rand = self.random.random()
         if significance_rand < self.config.final_probability:
             match_significance = 'final'
         elif significance_rand < self.config.tournament_probability:
@@ -386,35 +635,79 @@ class MockDataGenerator:
     
     def _generate_realistic_scores(self) -> Tuple[int, int]:
         """Generate realistic football scores based on real-world distributions."""
-        # Common football score patterns
-        score_patterns = [
-            (0, 0, 0.08), (1, 0, 0.12), (0, 1, 0.12), (1, 1, 0.15),
-            (2, 0, 0.10), (0, 2, 0.10), (2, 1, 0.12), (1, 2, 0.12),
-            (3, 0, 0.05), (0, 3, 0.05), (2, 2, 0.06), (3, 1, 0.04),
-            (1, 3, 0.04), (3, 2, 0.02), (2, 3, 0.02), (4, 0, 0.01)
-        ]
-        
         # Weighted random selection
-        scores = [(home, away) for home, away, _ in score_patterns]
-        weights = [weight for _, _, weight in score_patterns]
-        
-        return self.random.choices(scores, weights=weights)[0]
+        return self._weighted_pick(self._SCORES, self._SCORE_CUM_WEIGHTS)
     
     def _create_similar_order(self, original_order: DominosOrder) -> DominosOrder:
         """Create a similar order for high-activity periods."""
-        # Slight time variation (within 30 minutes)
-        time_offset = timedelta(minutes=self.random.randint(-30, 30))
-        new_time = original_order.timestamp + time_offset
-        
-        return DominosOrder(
-            order_id=f"{original_order.order_id}_EXTRA_{self.random.randint(1000, 9999)}",
-            timestamp=new_time,
-            location=original_order.location,  # Same location for correlation
-            order_total=self._generate_realistic_order_total(),
-            pizza_types=self._generate_pizza_selection(),
-            quantity=self._generate_order_quantity(),
-            data_source='mock'
+        return self._create_similar_orders([original_order])[0]
+    
+    def _create_similar_orders(self, original_orders: List[DominosOrder]) -> List[DominosOrder]:
+        """
+        Create one similar order per original for high-activity periods.
+        
+        Totals, pizza selections and quantities for all the copies are drawn
+        in batched calls rather than per copy.
+        
+        Args:
+            original_orders: Orders to create similar orders for
+            
+        Returns:
+            List of new orders, in the same order as original_orders
+        """
+        num_orders = len(original_orders)
+        totals = self._generate_order_totals(num_orders)
+        pizza_selections = self._generate_pizza_selections(num_orders)
+        quantities = self.random.choices(
+            self._QUANTITIES, cum_weights=self._QUANTITY_CUM_WEIGHTS, k=num_orders
         )
+        
+        # Uniform picks scale random() directly, avoiding the pure-Python
+        # randint/randrange wrappers
+        rng_random = self.random.random
+        offsets = self._EXTRA_ORDER_OFFSETS
+        num_offsets = len(offsets)
+        
+        return [
+            DominosOrder(
+                order_id=f"{original.order_id}_EXTRA_{1000 + int(rng_random() * 9000)}",
+                # Slight time variation (within 30 minutes)
+                timestamp=original.timestamp + offsets[int(rng_random() * num_offsets)],
+                location=original.location,  # Same location for correlation
+                order_total=totals[i],
+                pizza_types=pizza_selections[i],
+                quantity=quantities[i],
+                data_source='mock'
+            )
+            for i, original in enumerate(original_orders)
+        ]
+    
+    def _insert_similar_orders(self, orders: List[DominosOrder],
+                               has_extra: List[bool]) -> List[DominosOrder]:
+        """
+        Insert a similar order right after each order flagged in has_extra.
+        
+        Args:
+            orders: Orders to extend
+            has_extra: Per-order flags, parallel to orders
+            
+        Returns:
+            orders itself when nothing is flagged, otherwise a new list with
+            the similar orders interleaved
+        """
+        originals = list(compress(orders, has_extra))
+        if not originals:
+            return orders
+        
+        extras = iter(self._create_similar_orders(originals))
+        result = []
+        append_order = result.append
+        for order, extra in zip(orders, has_extra):
+            append_order(order)
+            if extra:
+                append_order(next(extras))
+        
+        return result
 
 
 def create_default_config(start_date: datetime, 
@@ -457,11 +750,9 @@ def generate_correlated_dataset(start_date: datetime,
     config = create_default_config(start_date, end_date, **config_kwargs)
     generator = MockDataGenerator(config)
     
-    # Generate base data
+    # Generate matches first so orders can be correlated as they are generated
     matches = generator.generate_football_matches()
-    orders = generator.generate_pizza_orders()
-    
-    # Apply temporal correlation
-    correlated_orders, correlated_matches = generator.correlate_data_timing(orders, matches)
+    match_effects = generator._calculate_match_effects(matches)
+    orders = generator.generate_pizza_orders(match_effects=match_effects)
     
-    return correlated_orders, correlated_matches
\ No newline at end of file
+    return orders, matches
\ No newline at end of file
@@ -94,12 +94,15 @@ Mathematical Foundation:
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 import pandas as pd
 import numpy as np
 from scipy import stats
-from dataclasses import asdict
+from dataclasses import fields
+from operator import attrgetter
+from itertools import count
 import uuid
 
 from src.models.pizza_order import DominosOrder
@@ -112,6 +115,63 @@ class CorrelationAnalysisError(Exception):
     pass
 
 
+_MATCH_COLUMNS = tuple(field.name for field in fields(FootballMatch))
+_ORDER_METRIC_COLUMNS = ('timestamp', 'order_total', 'quantity', 'location')
+
+# Outcome columns are categorical so equality tests compare small integer codes
+_WINNER_DTYPE = pd.CategoricalDtype(['home', 'away', 'draw'])
+# Winner codes indexed by np.sign(home_score - away_score) + 1
+_WINNER_CODES_BY_SIGN = np.array([1, 2, 0], dtype=np.int8)
+
+# Scoring patterns by total goals: 0, 1, 2-3, 4-5 and 6 or more
+_SCORING_PATTERN_BOUNDS = np.array([0, 1, 3, 5])
+_SCORING_PATTERNS = np.array(
+    ['scoreless', 'low_scoring', 'moderate_scoring', 'high_scoring', 'very_high_scoring'], dtype=object
+)
+
+# Event impact points by total goals (capped at 6): 5 per goal up to 30, plus
+# 10 for 3-4 goals or 20 for 5 or more
+_GOAL_IMPACT_POINTS = np.array([0, 5, 10, 25, 30, 45, 50], dtype=np.int64)
+# Event impact points by goal differential (capped at 3): draw, 1, 2, 3 or more
+_CLOSENESS_IMPACT_POINTS = np.array([20, 15, 10, 0], dtype=np.int64)
+_SIGNIFICANCE_DTYPE = pd.CategoricalDtype(['regular', 'tournament', 'final'])
+
+# Period metrics shared by every analyzer in the process, keyed on the input
+# attribute values and period lengths, oldest first, so repeated dashboard
+# runs and warm Lambda invocations reuse them
+_METRICS_CACHE: 'OrderedDict[tuple, pd.DataFrame]' = OrderedDict()
+
+
+def _records_to_columns(records: List[Any], columns: Tuple[str, ...]) -> Dict[str, list]:
+    """
+    Read the named attributes of each record into one list per column.
+    
+    Unlike dataclasses.asdict this does no recursive copy and builds no
+    per-record dict.
+    """
+    return {column: list(map(attrgetter(column), records)) for column in columns}
+
+
+def _rows_to_columns(rows: Tuple[tuple, ...], columns: Tuple[str, ...]) -> Dict[str, list]:
+    """Transpose non-empty attribute rows into one list per column."""
+    return dict(zip(columns, map(list, zip(*rows))))
+
+
+def _score_summary(home_scores: np.ndarray, away_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Total goals and signed goal difference (home minus away) of every match."""
+    return home_scores + away_scores, home_scores - away_scores
+
+
+def _datetime_series(values: list) -> pd.Series:
+    """
+    Convert a list of timestamps to a datetime64 Series in a single pass.
+    
+    Converting the raw list is cheaper than letting a Series or DataFrame
+    infer a dtype first and converting the column again afterwards.
+    """
+    return pd.Series(pd.to_datetime(values, cache=True))
+
+
 class CorrelationAnalyzer:
     """
     Correlation analysis engine for analyzing relationships between pizza orders and football matches.
@@ -123,6 +183,8 @@ class CorrelationAnalyzer:
     - Event classification logic for football match events
     """
     
+    metrics_cache_size = 4
+    
     def __init__(self):
         """Initialize the correlation analyzer."""
         self.logger = logging.getLogger(__name__)
@@ -153,116 +215,165 @@ class CorrelationAnalyzer:
             if not orders or not matches:
                 return pd.DataFrame()
             
-            # Convert to DataFrames for easier processing
-            orders_df = pd.DataFrame([asdict(order) for order in orders])
-            orders_df['timestamp'] = pd.to_datetime(orders_df['timestamp'])
-            
-            matches_df = pd.DataFrame([asdict(match) for match in matches])
-            matches_df['timestamp'] = pd.to_datetime(matches_df['timestamp'])
+            # Snapshot the attribute values the metrics depend on; they key
+            # the cache, so repeated runs over the same data return at once,
+            # and they are the columns the metrics are built from otherwise
+            order_rows = tuple(map(attrgetter(*_ORDER_METRIC_COLUMNS), orders))
+            match_rows = tuple(map(attrgetter(*_MATCH_COLUMNS), matches))
+            cache_key = (order_rows, match_rows, pre_match_hours, during_match_hours, post_match_hours)
+            cached_metrics = _METRICS_CACHE.get(cache_key)
+            if cached_metrics is not None:
+                _METRICS_CACHE.move_to_end(cache_key)
+                self.logger.info(f"Using cached metrics for {len(cached_metrics)} matches")
+                return cached_metrics.copy()
+            
+            order_columns = _rows_to_columns(order_rows, _ORDER_METRIC_COLUMNS)
+            order_times = _datetime_series(order_columns['timestamp']).to_numpy(dtype='datetime64[ns]')
+            
+            match_columns = _rows_to_columns(match_rows, _MATCH_COLUMNS)
+            match_timestamps = _datetime_series(match_columns['timestamp'])
+            
+            # Sort orders by time once so every period is a contiguous slice;
+            # the slice bounds for all matches come from vectorized binary
+            # searches instead of boolean masks over every order per match
+            sort_order = np.argsort(order_times, kind='stable')
+            order_times = order_times[sort_order]
+            order_totals = np.array(order_columns['order_total'], dtype=np.float64)[sort_order]
+            quantities = np.array(order_columns['quantity'], dtype=np.int64)[sort_order]
+            location_codes, locations = pd.factorize(np.asarray(order_columns['location'], dtype=object))
+            
+            # Key every order by (location, position in time order) so the
+            # orders of one location in a slice are one contiguous key range
+            order_positions = np.arange(len(sort_order), dtype=np.int64)
+            location_stride = len(sort_order) + 1
+            sorted_orders = {
+                'cumulative_totals': np.concatenate(([0.0], np.cumsum(order_totals))),
+                'cumulative_quantities': np.concatenate(([0], np.cumsum(quantities))),
+                'location_keys': np.sort(location_codes[sort_order].astype(np.int64) * location_stride + order_positions),
+                'location_offsets': np.arange(len(locations), dtype=np.int64) * location_stride
+            }
             
-            metrics_data = []
+            match_times = match_timestamps.to_numpy(dtype='datetime64[ns]')
+            
+            # Define time periods around the match as [lo, hi) order indices:
+            # pre-match [t - pre, t), during-match [t - d/2, t + d/2],
+            # post-match (t, t + post]. The periods overlap, so every edge of
+            # every match is found with one binary search per side instead
+            # of labelling each order with a single period
+            during_offset = np.timedelta64(during_match_hours // 2, 'h')
+            pre_start, match_start, during_start = np.searchsorted(
+                order_times,
+                np.concatenate((match_times - np.timedelta64(pre_match_hours, 'h'),
+                                match_times,
+                                match_times - during_offset)),
+                side='left'
+            ).reshape(3, -1)
+            during_end, match_end, post_end = np.searchsorted(
+                order_times,
+                np.concatenate((match_times + during_offset,
+                                match_times,
+                                match_times + np.timedelta64(post_match_hours, 'h'))),
+                side='right'
+            ).reshape(3, -1)
+            period_names = ('pre_match', 'during_match', 'post_match')
+            period_starts = np.stack((pre_start, during_start, match_end))
+            period_ends = np.stack((match_start, during_end, post_end))
+            
+            # Combine match info with metrics, column by column as typed
+            # arrays; no intermediate matches DataFrame is needed
+            home_scores = np.array(match_columns['home_score'], dtype=np.int64)
+            away_scores = np.array(match_columns['away_score'], dtype=np.int64)
+            total_goals, score_difference = _score_summary(home_scores, away_scores)
+            
+            metrics_columns = {
+                'match_id': match_columns['match_id'],
+                'match_timestamp': match_timestamps,
+                'home_team': match_columns['home_team'],
+                'away_team': match_columns['away_team'],
+                'home_score': home_scores,
+                'away_score': away_scores,
+                'event_type': match_columns['event_type'],
+                'match_significance': pd.Categorical(match_columns['match_significance'], dtype=_SIGNIFICANCE_DTYPE),
+                'data_source': match_columns['data_source'],
+                'winner': pd.Categorical.from_codes(
+                    _WINNER_CODES_BY_SIGN[np.sign(score_difference) + 1],
+                    dtype=_WINNER_DTYPE
+                ),
+                'total_goals': total_goals,
+                'is_high_scoring': total_goals >= 3
+            }
+            metrics_columns.update(self._calculate_period_metric_columns(
+                sorted_orders, period_starts, period_ends, period_names
+            ))
             
-            for _, match in matches_df.iterrows():
-                match_time = match['timestamp']
-                
-                # Define time periods around the match
-                pre_match_start = match_time - timedelta(hours=pre_match_hours)
-                pre_match_end = match_time
-                
-                during_match_start = match_time - timedelta(hours=during_match_hours // 2)
-                during_match_end = match_time + timedelta(hours=during_match_hours // 2)
-                
-                post_match_start = match_time
-                post_match_end = match_time + timedelta(hours=post_match_hours)
-                
-                # Calculate metrics for each period
-                pre_match_orders = orders_df[
-                    (orders_df['timestamp'] >= pre_match_start) &
-                    (orders_df['timestamp'] < pre_match_end)
-                ]
-                
-                during_match_orders = orders_df[
-                    (orders_df['timestamp'] >= during_match_start) &
-                    (orders_df['timestamp'] <= during_match_end)
-                ]
-                
-                post_match_orders = orders_df[
-                    (orders_df['timestamp'] > post_match_start) &
-                    (orders_df['timestamp'] <= post_match_end)
-                ]
-                
-                # Calculate volume metrics
-                pre_match_metrics = self._calculate_period_metrics(pre_match_orders, 'pre_match')
-                during_match_metrics = self._calculate_period_metrics(during_match_orders, 'during_match')
-                post_match_metrics = self._calculate_period_metrics(post_match_orders, 'post_match')
-                
-                # Combine match info with metrics
-                match_metrics = {
-                    'match_id': match['match_id'],
-                    'match_timestamp': match['timestamp'],
-                    'home_team': match['home_team'],
-                    'away_team': match['away_team'],
-                    'home_score': match['home_score'],
-                    'away_score': match['away_score'],
-                    'event_type': match['event_type'],
-                    'match_significance': match['match_significance'],
-                    'data_source': match['data_source'],
-                    'winner': self._get_match_winner(match['home_score'], match['away_score']),
-                    'total_goals': match['home_score'] + match['away_score'],
-                    'is_high_scoring': (match['home_score'] + match['away_score']) >= 3,
-                    **pre_match_metrics,
-                    **during_match_metrics,
-                    **post_match_metrics
-                }
-                
-                metrics_data.append(match_metrics)
+            metrics_df = pd.DataFrame(metrics_columns)
             
-            metrics_df = pd.DataFrame(metrics_data)
+            _METRICS_CACHE[cache_key] = metrics_df
+            if len(_METRICS_CACHE) > self.metrics_cache_size:
+                _METRICS_CACHE.popitem(last=False)
             
             self.logger.info(f"Calculated metrics for {len(metrics_df)} matches")
-            return metrics_df
+            return metrics_df.copy()
             
         except Exception as e:
             raise CorrelationAnalysisError(f"Failed to calculate match period metrics: {str(e)}")
     
-    def _calculate_period_metrics(self, period_orders: pd.DataFrame, period_name: str) -> Dict[str, Any]:
+    def _calculate_period_metric_columns(self, sorted_orders: Dict[str, np.ndarray],
+                                         lo: np.ndarray, hi: np.ndarray,
+                                         period_names: Tuple[str, ...]) -> Dict[str, np.ndarray]:
         """
-        Calculate order volume metrics for a specific time period.
+        Calculate order volume metric columns for every time period of every match.
+        
+        Each match's period is the slice [lo, hi) of the time-sorted orders,
+        so sums come from differences of cumulative sums, evaluated for all
+        periods at once.
         
         Args:
-            period_orders: DataFrame of orders in the time period
-            period_name: Name of the period ('pre_match', 'during_match', 'post_match')
+            sorted_orders: 'cumulative_totals' and 'cumulative_quantities' of the
+                time-sorted orders (with a leading 0), their sorted
+                'location_keys' (location code * stride + position) and the
+                'location_offsets' (location code * stride) of every location
+            lo: Start index of each period (inclusive), one row per period
+            hi: End index of each period (exclusive), one row per period
+            period_names: Names of the periods in row order
+                ('pre_match', 'during_match', 'post_match')
             
         Returns:
-            Dictionary of metrics for the period
-        """
-        if period_orders.empty:
-            return {
-                f'{period_name}_order_count': 0,
-                f'{period_name}_total_volume': 0.0,
-                f'{period_name}_avg_order_value': 0.0,
-                f'{period_name}_pizza_count': 0,
-                f'{period_name}_unique_locations': 0,
-                f'{period_name}_orders_per_hour': 0.0
-            }
+            Dictionary of metric column name to per-match values, grouped by period
+        """
+        order_counts = hi - lo
         
-        return {
-            f'{period_name}_order_count': len(period_orders),
-            f'{period_name}_total_volume': period_orders['order_total'].sum(),
-            f'{period_name}_avg_order_value': period_orders['order_total'].mean(),
-            f'{period_name}_pizza_count': period_orders['quantity'].sum(),
-            f'{period_name}_unique_locations': period_orders['location'].nunique(),
-            f'{period_name}_orders_per_hour': len(period_orders) / 2.0  # Assuming 2-hour periods
-        }
-    
-    def _get_match_winner(self, home_score: int, away_score: int) -> str:
-        """Determine match winner from scores."""
-        if home_score > away_score:
-            return 'home'
-        elif away_score > home_score:
-            return 'away'
-        else:
-            return 'draw'
+        cumulative_totals = sorted_orders['cumulative_totals']
+        cumulative_quantities = sorted_orders['cumulative_quantities']
+        total_volumes = cumulative_totals[hi] - cumulative_totals[lo]
+        pizza_counts = cumulative_quantities[hi] - cumulative_quantities[lo]
+        
+        avg_order_values = np.zeros(order_counts.shape)
+        np.divide(total_volumes, order_counts, out=avg_order_values, where=order_counts > 0)
+        
+        # A location is present in [lo, hi) when its key range for that
+        # slice is non-empty; one searchsorted covers every period and location
+        location_keys = sorted_orders['location_keys']
+        location_offsets = sorted_orders['location_offsets']
+        location_present = (
+            np.searchsorted(location_keys, location_offsets + hi[..., np.newaxis])
+            > np.searchsorted(location_keys, location_offsets + lo[..., np.newaxis])
+        )
+        unique_locations = location_present.sum(axis=-1)
+        
+        orders_per_hour = order_counts / 2.0  # Assuming 2-hour periods
+        
+        columns = {}
+        for i, period_name in enumerate(period_names):
+            columns.update({
+                f'{period_name}_order_count': order_counts[i],
+                f'{period_name}_total_volume': total_volumes[i],
+                f'{period_name}_avg_order_value': avg_order_values[i],
+                f'{period_name}_pizza_count': pizza_counts[i],
+                f'{period_name}_unique_locations': unique_locations[i],
+                f'{period_name}_orders_per_hour': orders_per_hour[i]
+            })
+        return columns
     
     def calculate_correlation_coefficients(self, metrics_df: pd.DataFrame) -> List[CorrelationResult]:
         """
@@ -284,15 +395,18 @@ class CorrelationAnalyzer:
             
             correlation_results = []
             
-            # Define outcome variables to correlate with
+            # Define outcome variables to correlate with; the casts are no-ops
+            # for metrics from calculate_match_period_metrics
+            winner = metrics_df['winner'].astype(_WINNER_DTYPE)
+            significance = metrics_df['match_significance'].astype(_SIGNIFICANCE_DTYPE)
             outcome_variables = {
-                'home_wins': metrics_df['winner'] == 'home',
-                'away_wins': metrics_df['winner'] == 'away',
-                'draws': metrics_df['winner'] == 'draw',
+                'home_wins': winner == 'home',
+                'away_wins': winner == 'away',
+                'draws': winner == 'draw',
                 'high_scoring_matches': metrics_df['is_high_scoring'],
                 'total_goals': metrics_df['total_goals'],
-                'tournament_matches': metrics_df['match_significance'] == 'tournament',
-                'final_matches': metrics_df['match_significance'] == 'final'
+                'tournament_matches': significance == 'tournament',
+                'final_matches': significance == 'final'
             }
             
             # Define order volume variables
@@ -308,22 +422,43 @@ class CorrelationAnalyzer:
                 'post_match_orders_per_hour': 'post_match_orders_per_hour'
             }
             
-            # Calculate correlations for each combination
-            for outcome_name, outcome_data in outcome_variables.items():
-                for volume_name, volume_column in volume_variables.items():
-                    if volume_column in metrics_df.columns:
+            available_volumes = {
+                volume_name: volume_column
+                for volume_name, volume_column in volume_variables.items()
+                if volume_column in metrics_df.columns
+            }
+            
+            # Data quality depends only on metrics_df, so score it once for all results
+            data_quality = self._calculate_data_quality_score(metrics_df)
+            analysis_ids = self._analysis_id_sequence()
+            
+            # Calculate correlations for every combination at once
+            matrix_results = self._calculate_correlation_matrix(
+                metrics_df, outcome_variables, available_volumes, data_quality, analysis_ids
+            )
+            normalized_volumes = None
+            if matrix_results is not None:
+                matrix_correlations, normalized_volumes = matrix_results
+                correlation_results.extend(matrix_correlations)
+            else:
+                # Missing values: correlate each pair on its own complete rows
+                for outcome_name, outcome_data in outcome_variables.items():
+                    for volume_name, volume_column in available_volumes.items():
                         correlation_result = self._calculate_single_correlation(
                             metrics_df[volume_column],
                             outcome_data,
                             outcome_name,
                             volume_name,
-                            metrics_df
+                            data_quality,
+                            analysis_ids
                         )
                         if correlation_result:
                             correlation_results.append(correlation_result)
             
             # Calculate period-to-period correlations (order spike patterns)
-            period_correlations = self._calculate_period_correlations(metrics_df)
+            period_correlations = self._calculate_period_correlations(
+                metrics_df, data_quality, analysis_ids, normalized_volumes
+            )
             correlation_results.extend(period_correlations)
             
             self.logger.info(f"Calculated {len(correlation_results)} correlation coefficients")
@@ -332,9 +467,110 @@ class CorrelationAnalyzer:
         except Exception as e:
             raise CorrelationAnalysisError(f"Failed to calculate correlation coefficients: {str(e)}")
     
+    def _calculate_correlation_matrix(self, metrics_df: pd.DataFrame,
+                                      outcome_variables: Dict[str, pd.Series],
+                                      volume_columns: Dict[str, str],
+                                      data_quality: float,
+                                      analysis_ids: Iterator[str]
+                                      ) -> Optional[Tuple[List[CorrelationResult], Dict[str, np.ndarray]]]:
+        """
+        Correlate every outcome variable with every volume column in one pass.
+        
+        Equivalent to calling _calculate_single_correlation for each pair, but
+        the coefficients come from a single matrix product of the normalized
+        columns and the p-values from one vectorized t-distribution call.
+        Point-biserial correlation is Pearson correlation with the binary
+        variable coded 0/1, so boolean outcomes need no separate handling.
+        
+        Args:
+            metrics_df: DataFrame with match and order metrics
+            outcome_variables: Outcome name to per-match outcome data
+            volume_columns: Volume name to metrics_df column name
+            data_quality: Data quality score of metrics_df
+            analysis_ids: Source of analysis IDs for the results
+            
+        Returns:
+            CorrelationResult objects in outcome-major order and the normalized
+            volume vectors keyed by column name, for reuse by further
+            correlations; None when the data contains missing or non-numeric
+            values and each pair has to be cleaned separately
+        """
+        try:
+            volumes = metrics_df[list(volume_columns.values())].to_numpy(dtype=np.float64)
+            outcomes = np.column_stack([
+                np.asarray(outcome_data, dtype=np.float64) for outcome_data in outcome_variables.values()
+            ])
+        except (TypeError, ValueError):
+            return None
+        
+        if np.isnan(volumes).any() or np.isnan(outcomes).any():
+            return None
+        
+        normalized_volumes = self._normalize_columns(volumes)
+        volume_vectors = dict(zip(volume_columns.values(), normalized_volumes.T))
+        
+        sample_size = len(volumes)
+        if sample_size < 3:  # Need at least 3 data points
+            return [], volume_vectors
+        
+        correlations, p_values = self._correlation_p_values(
+            self._normalize_columns(outcomes).T @ normalized_volumes, sample_size
+        )
+        
+        results = []
+        for i, outcome_name in enumerate(outcome_variables):
+            for j, volume_name in enumerate(volume_columns):
+                correlation_coef = correlations[i, j]
+                p_value = p_values[i, j]
+                
+                # Handle NaN correlations (when there's no variation in data)
+                if np.isnan(correlation_coef) or np.isnan(p_value):
+                    continue
+                
+                results.append(self._build_correlation_result(
+                    correlation_coef, p_value, outcome_name, volume_name, sample_size,
+                    data_quality, analysis_ids
+                ))
+        
+        return results, volume_vectors
+    
+    @staticmethod
+    def _normalize_columns(columns: np.ndarray) -> np.ndarray:
+        """
+        Center each column and scale it to unit length.
+        
+        The Pearson correlation of two columns is then the dot product of
+        their normalized vectors. Constant columns become all NaN.
+        """
+        centered = columns - columns.mean(axis=0)
+        # Column norms via einsum and an in-place divide, so no squared or
+        # scaled temporaries of the full matrix are allocated
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centered /= np.sqrt(np.einsum('ij,ij->j', centered, centered))
+        return centered
+    
+    @staticmethod
+    def _correlation_p_values(correlations: np.ndarray, sample_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Clip correlation coefficients to [-1, 1] and compute their two-sided p-values.
+        
+        Args:
+            correlations: Pearson correlation coefficients
+            sample_size: Number of observations behind every coefficient
+            
+        Returns:
+            Tuple of clipped coefficients and p-values from the t-distribution
+            with sample_size - 2 degrees of freedom
+        """
+        correlations = np.clip(correlations, -1.0, 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_statistics = correlations * np.sqrt((sample_size - 2) / (1.0 - correlations ** 2))
+        return correlations, 2 * stats.t.sf(np.abs(t_statistics), sample_size - 2)
+    
     def _calculate_single_correlation(self, volume_data: pd.Series, outcome_data: pd.Series,
                                     outcome_name: str, volume_name: str,
-                                    metrics_df: pd.DataFrame) -> Optional[CorrelationResult]:
+                                    data_quality: float,
+                                    analysis_ids: Iterator[str]) -> Optional[CorrelationResult]:
         """
         Calculate a single correlation coefficient with comprehensive statistical validation.
         
@@ -342,8 +578,10 @@ class CorrelationAnalyzer:
         and validation to ensure meaningful and reliable correlation results.
         
         Statistical Method Selection:
-        - Point-biserial correlation: Used when outcome_data is binary (True/False, Win/Loss)
+        - Point-biserial correlation: Used when outcome_data is binary (True/False, Win/Loss),
+          computed as Pearson correlation with the outcome coded 0/1
         - Pearson correlation: Used when outcome_data is continuous (scores, counts)
+        Both therefore share the vectorized path of _calculate_correlation_matrix.
         
         Data Validation Steps:
         1. Check for sufficient sample size (minimum 3 data points)
@@ -370,7 +608,8 @@ class CorrelationAnalyzer:
                          Examples: win/loss (binary), total_goals (continuous)
             outcome_name: Human-readable name of outcome variable for reporting
             volume_name: Human-readable name of volume variable for reporting
-            metrics_df: Complete metrics DataFrame for data quality assessment
+            data_quality: Data quality score of the complete metrics DataFrame
+            analysis_ids: Source of analysis IDs, see _analysis_id_sequence
             
         Returns:
             CorrelationResult object containing:
@@ -398,105 +637,190 @@ class CorrelationAnalyzer:
         - Practical significance may differ from statistical significance
         """
         try:
-            # Remove any NaN values
-            valid_mask = ~(pd.isna(volume_data) | pd.isna(outcome_data))
-            clean_volume = volume_data[valid_mask]
-            clean_outcome = outcome_data[valid_mask]
+            clean_volume = volume_data.to_numpy(dtype=np.float64, na_value=np.nan)
+            clean_outcome = outcome_data.to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # Remove any NaN values; a single mask is built in place and only
+            # applied when something is actually missing
+            missing = np.isnan(clean_volume)
+            np.logical_or(missing, np.isnan(clean_outcome), out=missing)
+            if missing.any():
+                present = np.logical_not(missing, out=missing)
+                clean_volume = clean_volume[present]
+                clean_outcome = clean_outcome[present]
             
             if len(clean_volume) < 3:  # Need at least 3 data points
                 return None
             
-            # Calculate correlation coefficient and p-value
-            if clean_outcome.dtype == bool:
-                # For boolean outcomes, use point-biserial correlation
-                correlation_coef, p_value = stats.pointbiserialr(clean_outcome, clean_volume)
-            else:
-                # For continuous outcomes, use Pearson correlation
-                correlation_coef, p_value = stats.pearsonr(clean_volume, clean_outcome)
-            
-            # Handle NaN correlations (when there's no variation in data)
-            if np.isnan(correlation_coef) or np.isnan(p_value):
-                return None
-            
-            # Determine time window from volume variable name
-            if 'pre_match' in volume_name:
-                time_window = 'pre_match'
-            elif 'during_match' in volume_name:
-                time_window = 'during_match'
-            elif 'post_match' in volume_name:
-                time_window = 'post_match'
-            else:
-                time_window = 'full_match'
-            
-            # Generate pattern description
-            pattern_description = self._generate_pattern_description(
-                correlation_coef, p_value, outcome_name, volume_name, time_window
-            )
-            
-            # Calculate data quality score
-            data_quality = self._calculate_data_quality_score(metrics_df)
-            
-            return CorrelationResult(
-                analysis_id=str(uuid.uuid4()),
-                correlation_coefficient=float(correlation_coef),
-                statistical_significance=float(p_value),
-                time_window=time_window,
-                pattern_description=pattern_description,
-                data_quality=data_quality,
-                analysis_timestamp=datetime.utcnow(),
-                sample_size=len(clean_volume)
+            # Calculate correlation coefficient and p-value; constant columns
+            # normalize to NaN and are rejected there
+            normalized_volume, normalized_outcome = self._normalize_columns(
+                np.column_stack((clean_volume, clean_outcome))
+            ).T
+            return self._correlate_normalized_vectors(
+                normalized_volume, normalized_outcome, outcome_name, volume_name,
+                data_quality, analysis_ids
             )
             
         except Exception as e:
             self.logger.warning(f"Failed to calculate correlation for {outcome_name} vs {volume_name}: {str(e)}")
             return None
     
-    def _calculate_period_correlations(self, metrics_df: pd.DataFrame) -> List[CorrelationResult]:
+    def _build_correlation_result(self, correlation_coef: float, p_value: float,
+                                  outcome_name: str, volume_name: str, sample_size: int,
+                                  data_quality: float,
+                                  analysis_ids: Iterator[str]) -> CorrelationResult:
+        """
+        Wrap a computed correlation in a CorrelationResult.
+        
+        Args:
+            correlation_coef: Correlation coefficient
+            p_value: Statistical significance p-value
+            outcome_name: Name of the outcome variable
+            volume_name: Name of the volume variable
+            sample_size: Number of observations in the calculation
+            data_quality: Data quality score of the complete metrics DataFrame
+            analysis_ids: Source of analysis IDs; the next one is used
+            
+        Returns:
+            CorrelationResult with time window and description filled in
+        """
+        # Determine time window from volume variable name
+        if 'pre_match' in volume_name:
+            time_window = 'pre_match'
+        elif 'during_match' in volume_name:
+            time_window = 'during_match'
+        elif 'post_match' in volume_name:
+            time_window = 'post_match'
+        else:
+            time_window = 'full_match'
+        
+        # Generate pattern description
+        pattern_description = self._generate_pattern_description(
+            correlation_coef, p_value, outcome_name, volume_name, time_window
+        )
+        
+        return CorrelationResult(
+            analysis_id=next(analysis_ids),
+            correlation_coefficient=float(correlation_coef),
+            statistical_significance=float(p_value),
+            time_window=time_window,
+            pattern_description=pattern_description,
+            data_quality=data_quality,
+            analysis_timestamp=datetime.utcnow(),
+            sample_size=sample_size
+        )
+    
+    def _calculate_period_correlations(self, metrics_df: pd.DataFrame,
+                                       data_quality: float,
+                                       analysis_ids: Iterator[str],
+                                       normalized_volumes: Optional[Dict[str, np.ndarray]] = None
+                                       ) -> List[CorrelationResult]:
         """
         Calculate correlations between different time periods to identify order spike patterns.
         
         Args:
             metrics_df: DataFrame with match and order metrics
+            data_quality: Data quality score of metrics_df
+            analysis_ids: Source of analysis IDs for the results
+            normalized_volumes: Normalized volume vectors from
+                _calculate_correlation_matrix; each correlation is then a dot
+                product instead of a fresh scipy call
             
         Returns:
             List of CorrelationResult objects for period correlations
         """
         period_correlations = []
         
+        # Pre-match to post-match order correlation, then during-match to
+        # post-match correlation (immediate reaction)
+        period_pairs = (
+            ('pre_match_order_count', 'pre_to_post_match', 'pre-match'),
+            ('during_match_order_count', 'during_to_post_match', 'during-match')
+        )
+        
         try:
-            # Pre-match to post-match order correlation
-            if 'pre_match_order_count' in metrics_df.columns and 'post_match_order_count' in metrics_df.columns:
-                pre_post_corr = self._calculate_single_correlation(
-                    metrics_df['pre_match_order_count'],
-                    metrics_df['post_match_order_count'],
-                    'post_match_orders',
-                    'pre_match_order_count',
-                    metrics_df
-                )
-                if pre_post_corr:
-                    pre_post_corr.time_window = 'pre_to_post_match'
-                    pre_post_corr.pattern_description = f"Correlation between pre-match and post-match order volumes: {pre_post_corr.get_strength_description()} {pre_post_corr.get_direction_description()} relationship"
-                    period_correlations.append(pre_post_corr)
-            
-            # During-match to post-match correlation (immediate reaction)
-            if 'during_match_order_count' in metrics_df.columns and 'post_match_order_count' in metrics_df.columns:
-                during_post_corr = self._calculate_single_correlation(
-                    metrics_df['during_match_order_count'],
-                    metrics_df['post_match_order_count'],
-                    'post_match_orders',
-                    'during_match_order_count',
-                    metrics_df
-                )
-                if during_post_corr:
-                    during_post_corr.time_window = 'during_to_post_match'
-                    during_post_corr.pattern_description = f"Correlation between during-match and post-match order volumes: {during_post_corr.get_strength_description()} {during_post_corr.get_direction_description()} relationship"
-                    period_correlations.append(during_post_corr)
+            if 'post_match_order_count' not in metrics_df.columns:
+                return period_correlations
+            
+            for volume_column, time_window, period_label in period_pairs:
+                if volume_column not in metrics_df.columns:
+                    continue
+                
+                if normalized_volumes is not None:
+                    period_corr = self._correlate_normalized_vectors(
+                        normalized_volumes[volume_column],
+                        normalized_volumes['post_match_order_count'],
+                        'post_match_orders',
+                        volume_column,
+                        data_quality,
+                        analysis_ids
+                    )
+                else:
+                    period_corr = self._calculate_single_correlation(
+                        metrics_df[volume_column],
+                        metrics_df['post_match_order_count'],
+                        'post_match_orders',
+                        volume_column,
+                        data_quality,
+                        analysis_ids
+                    )
+                if period_corr:
+                    period_corr.time_window = time_window
+                    period_corr.pattern_description = f"Correlation between {period_label} and post-match order volumes: {period_corr.get_strength_description()} {period_corr.get_direction_description()} relationship"
+                    period_correlations.append(period_corr)
             
         except Exception as e:
             self.logger.warning(f"Failed to calculate period correlations: {str(e)}")
         
         return period_correlations
     
+    def _correlate_normalized_vectors(self, volume_vector: np.ndarray, outcome_vector: np.ndarray,
+                                      outcome_name: str, volume_name: str,
+                                      data_quality: float,
+                                      analysis_ids: Iterator[str]) -> Optional[CorrelationResult]:
+        """
+        Correlate two columns already normalized by _normalize_columns.
+        
+        Args:
+            volume_vector: Normalized volume column
+            outcome_vector: Normalized outcome column
+            outcome_name: Name of the outcome variable
+            volume_name: Name of the volume variable
+            data_quality: Data quality score of the complete metrics DataFrame
+            analysis_ids: Source of analysis IDs, see _analysis_id_sequence
+            
+        Returns:
+            CorrelationResult, or None with fewer than 3 observations or no
+            variation in either column
+        """
+        sample_size = len(volume_vector)
+        if sample_size < 3:  # Need at least 3 data points
+            return None
+        
+        correlation_coef, p_value = self._correlation_p_values(volume_vector @ outcome_vector, sample_size)
+        
+        # Handle NaN correlations (when there's no variation in data)
+        if np.isnan(correlation_coef) or np.isnan(p_value):
+            return None
+        
+        return self._build_correlation_result(
+            correlation_coef, p_value, outcome_name, volume_name, sample_size,
+            data_quality, analysis_ids
+        )
+    
+    @staticmethod
+    def _analysis_id_sequence() -> Iterator[str]:
+        """
+        Generate analysis IDs for one batch of correlation results.
+        
+        One random UUID prefix per batch keeps IDs unique across runs, and a
+        counter suffix keeps them unique within the batch without drawing a
+        new UUID for every result.
+        """
+        batch_id = uuid.uuid4().hex
+        return (f"{batch_id}-{index}" for index in count())
+    
     def _generate_pattern_description(self, correlation_coef: float, p_value: float,
                                     outcome_name: str, volume_name: str, time_window: str) -> str:
         """
@@ -609,27 +933,54 @@ class CorrelationAnalyzer:
             if not matches:
                 return pd.DataFrame()
             
-            # Convert to DataFrame
-            matches_df = pd.DataFrame([asdict(match) for match in matches])
+            # Read the match attributes column-wise; the classification
+            # columns are computed on arrays and the DataFrame is built once
+            match_columns = _records_to_columns(matches, _MATCH_COLUMNS)
             
             # Add enhanced event classifications
-            matches_df['goal_differential'] = abs(matches_df['home_score'] - matches_df['away_score'])
-            matches_df['total_goals'] = matches_df['home_score'] + matches_df['away_score']
+            total_goals, score_difference = _score_summary(
+                np.array(match_columns['home_score'], dtype=np.int64),
+                np.array(match_columns['away_score'], dtype=np.int64)
+            )
+            goal_diff = np.abs(score_difference, out=score_difference)
+            match_columns['goal_differential'] = goal_diff
+            match_columns['total_goals'] = total_goals
+            
+            # Classifications are evaluated over whole columns
+            significance = np.array(match_columns['match_significance'], dtype=object)
             
             # Classify match excitement level
-            matches_df['excitement_level'] = matches_df.apply(self._classify_excitement_level, axis=1)
+            match_columns['excitement_level'] = np.select(
+                [total_goals >= 5, (total_goals >= 3) & (goal_diff <= 1), total_goals >= 2],
+                ['very_high', 'high', 'medium'],
+                default='low'
+            ).astype(object)
             
             # Classify match outcome type
-            matches_df['outcome_type'] = matches_df.apply(self._classify_outcome_type, axis=1)
+            match_columns['outcome_type'] = np.select(
+                [goal_diff == 0, goal_diff >= 3, goal_diff == 1],
+                ['draw', 'blowout', 'close_win'],
+                default='comfortable_win'
+            ).astype(object)
             
-            # Classify scoring pattern
-            matches_df['scoring_pattern'] = matches_df.apply(self._classify_scoring_pattern, axis=1)
+            # Classify scoring pattern: one binary search into the goal tiers
+            match_columns['scoring_pattern'] = _SCORING_PATTERNS[
+                np.searchsorted(_SCORING_PATTERN_BOUNDS, total_goals, side='left')
+            ]
             
             # Classify match importance
-            matches_df['importance_level'] = matches_df.apply(self._classify_importance_level, axis=1)
+            match_columns['importance_level'] = np.select(
+                [significance == 'final', significance == 'tournament'],
+                ['critical', 'high'],
+                default='regular'
+            ).astype(object)
             
             # Add event impact score (0-100)
-            matches_df['event_impact_score'] = matches_df.apply(self._calculate_event_impact_score, axis=1)
+            match_columns['event_impact_score'] = self._calculate_event_impact_scores(
+                total_goals, goal_diff, significance
+            )
+            
+            matches_df = pd.DataFrame(match_columns)
             
             self.logger.info(f"Classified {len(matches_df)} football match events")
             return matches_df
@@ -637,101 +988,30 @@ class CorrelationAnalyzer:
         except Exception as e:
             raise CorrelationAnalysisError(f"Failed to classify football events: {str(e)}")
     
-    def _classify_excitement_level(self, match_row: pd.Series) -> str:
-        """Classify match excitement based on goals and outcome."""
-        total_goals = match_row['total_goals']
-        goal_diff = match_row['goal_differential']
-        
-        if total_goals >= 5:
-            return 'very_high'
-        elif total_goals >= 3 and goal_diff <= 1:
-            return 'high'
-        elif total_goals >= 2:
-            return 'medium'
-        else:
-            return 'low'
-    
-    def _classify_outcome_type(self, match_row: pd.Series) -> str:
-        """Classify the type of match outcome."""
-        home_score = match_row['home_score']
-        away_score = match_row['away_score']
-        
-        if home_score == away_score:
-            return 'draw'
-        elif abs(home_score - away_score) >= 3:
-            return 'blowout'
-        elif abs(home_score - away_score) == 1:
-            return 'close_win'
-        else:
-            return 'comfortable_win'
-    
-    def _classify_scoring_pattern(self, match_row: pd.Series) -> str:
-        """Classify the scoring pattern of the match."""
-        total_goals = match_row['total_goals']
-        
-        if total_goals == 0:
-            return 'scoreless'
-        elif total_goals == 1:
-            return 'low_scoring'
-        elif total_goals <= 3:
-            return 'moderate_scoring'
-        elif total_goals <= 5:
-            return 'high_scoring'
-        else:
-            return 'very_high_scoring'
-    
-    def _classify_importance_level(self, match_row: pd.Series) -> str:
-        """Classify the importance level of the match."""
-        significance = match_row['match_significance']
-        
-        if significance == 'final':
-            return 'critical'
-        elif significance == 'tournament':
-            return 'high'
-        else:
-            return 'regular'
-    
-    def _calculate_event_impact_score(self, match_row: pd.Series) -> int:
+    def _calculate_event_impact_scores(self, total_goals: np.ndarray, goal_diff: np.ndarray,
+                                       significance: np.ndarray) -> np.ndarray:
         """
-        Calculate an event impact score (0-100) based on multiple factors.
+        Calculate event impact scores (0-100) for whole columns of matches.
         
         Args:
-            match_row: Row containing match data
+            total_goals: Total goals per match
+            goal_diff: Absolute goal differential per match
+            significance: Match significance per match
             
         Returns:
-            Impact score from 0-100
+            Impact score from 0-100 per match
         """
-        score = 0
-        
-        # Base score from total goals (0-30 points)
-        total_goals = match_row['total_goals']
-        score += min(total_goals * 5, 30)
+        # Base score from total goals (0-30 points) plus the bonus for
+        # high-scoring matches (0-20 points), looked up in one gather
+        scores = _GOAL_IMPACT_POINTS[np.minimum(total_goals, len(_GOAL_IMPACT_POINTS) - 1)]
         
         # Bonus for close matches (0-20 points)
-        goal_diff = match_row['goal_differential']
-        if goal_diff == 0:
-            score += 20  # Draw
-        elif goal_diff == 1:
-            score += 15  # Very close
-        elif goal_diff == 2:
-            score += 10  # Close
+        scores += _CLOSENESS_IMPACT_POINTS[np.minimum(goal_diff, len(_CLOSENESS_IMPACT_POINTS) - 1)]
         
         # Bonus for match significance (0-30 points)
-        significance = match_row['match_significance']
-        if significance == 'final':
-            score += 30
-        elif significance == 'tournament':
-            score += 20
-        else:
-            score += 10
-        
-        # Bonus for high-scoring matches (0-20 points)
-        if total_goals >= 5:
-            score += 20
-        elif total_goals >= 3:
-            score += 10
+        scores += np.select([significance == 'final', significance == 'tournament'], [30, 20], default=10)
         
-        return min(score, 100)  # Cap at 100
+        return np.minimum(scores, 100, out=scores)  # Cap at 100
     
     def generate_correlation_summary(self, correlation_results: List[CorrelationResult]) -> Dict[str, Any]:
         """
@@ -9,7 +9,7 @@ import csv
 from io import StringIO
 
 
-@dataclass
+@dataclass(slots=True)
 class FootballMatch:
     """
     Data model for football matches with validation methods.
@@ -9,7 +9,7 @@ import csv
 from io import StringIO
 
 
-@dataclass
+@dataclass(slots=True)
 class DominosOrder:
     """
     Data model for Domino's pizza orders with validation methods.
@@ -8,6 +8,7 @@ defined in the design document.
 
 import boto3
 import json
+import orjson
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
@@ -184,8 +185,18 @@ class S3Service:
             # Generate S3 key with proper naming convention
             s3_key = self._generate_file_key(data_type, data_source, filename, timestamp)
             
-            # Convert data to JSON string
-            json_data = json.dumps(data, indent=2, default=str)
+            # Serialize to compact JSON bytes. Datetimes are passed through to
+            # default=str so they keep the str() format ("2024-01-01 12:00:00")
+            # that json.dumps wrote before; NaN/Infinity are written as null.
+            json_data = orjson.dumps(
+                data,
+                default=str,
+                option=(
+                    orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            )
             
             # Determine record count
             record_count = len(data) if isinstance(data, list) else 1
@@ -0,0 +1,114 @@
+"""
+Tests for the deployment package ZIP writer
+"""
+import zipfile
+
+import pytest
+
+import deploy
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Create a small directory tree to package"""
+    source_dir = tmp_path / "source"
+    (source_dir / "pkg" / "sub").mkdir(parents=True)
+    (source_dir / "lambda_function.py").write_text("def handler(event, context):\n    return {}\n")
+    (source_dir / "pkg" / "__init__.py").write_text("")
+    (source_dir / "pkg" / "sub" / "data.bin").write_bytes(bytes(range(256)) * 64)
+    return source_dir
+
+
+def _expected_contents(source_dir):
+    return {
+        path.relative_to(source_dir).as_posix(): path.read_bytes()
+        for path in source_dir.rglob("*") if path.is_file()
+    }
+
+
+def _assert_archive_matches(zip_path, expected):
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        assert sorted(zipf.namelist()) == sorted(expected)
+        for name, data in expected.items():
+            assert zipf.read(name) == data
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+def test_zip_directory_write_mode_round_trip(tmp_path, source_tree, compression):
+    """Test that a freshly written archive passes testzip and holds every file"""
+    zip_path = tmp_path / "package.zip"
+    with zipfile.ZipFile(zip_path, 'w', compression, compresslevel=9) as zipf:
+        assert deploy._supports_precompressed_write(zipf)
+        deploy._zip_directory(zipf, source_tree, compression, 9)
+    
+    _assert_archive_matches(zip_path, _expected_contents(source_tree))
+
+
+def test_zip_directory_append_mode_round_trip(tmp_path, source_tree):
+    """Test that appending to a cached archive keeps both sets of members intact"""
+    zip_path = tmp_path / "package.zip"
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+        deploy._zip_directory(zipf, source_tree, zipfile.ZIP_DEFLATED, 9)
+    
+    extra_dir = tmp_path / "extra"
+    (extra_dir / "src").mkdir(parents=True)
+    (extra_dir / "src" / "module.py").write_text("VALUE = 1\n")
+    with zipfile.ZipFile(zip_path, 'a', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+        deploy._zip_directory(zipf, extra_dir, zipfile.ZIP_DEFLATED, 9)
+    
+    expected = _expected_contents(source_tree)
+    expected.update(_expected_contents(extra_dir))
+    _assert_archive_matches(zip_path, expected)
+
+
+def test_zip_directory_falls_back_without_zipfile_internals(tmp_path, source_tree, monkeypatch):
+    """Test that the public ZipFile.write() path is used when internals are missing"""
+    monkeypatch.setattr(deploy, "PRECOMPRESSED_WRITE_ATTRS", ("no_such_attribute",))
+    
+    zip_path = tmp_path / "package.zip"
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+        assert not deploy._supports_precompressed_write(zipf)
+        deploy._zip_directory(zipf, source_tree, zipfile.ZIP_DEFLATED, 9)
+    
+    _assert_archive_matches(zip_path, _expected_contents(source_tree))
+
+
+def test_dependency_cache_key_covers_build_settings(tmp_path, monkeypatch):
+    """Test that the cache key changes with the runtime and cleanup settings"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / deploy.REQUIREMENTS_FILE).write_text("requests==2.31.0\n")
+    
+    base = deploy._dependency_cache_path(zipfile.ZIP_DEFLATED, 9)
+    assert deploy._dependency_cache_path(zipfile.ZIP_DEFLATED, 9) == base
+    
+    runtime_version = deploy.LAMBDA_PYTHON_VERSION
+    monkeypatch.setattr(deploy, "LAMBDA_PYTHON_VERSION", "3.12")
+    assert deploy._dependency_cache_path(zipfile.ZIP_DEFLATED, 9) != base
+    monkeypatch.setattr(deploy, "LAMBDA_PYTHON_VERSION", runtime_version)
+    
+    monkeypatch.setattr(deploy, "CLEANUP_SUFFIXES", deploy.CLEANUP_SUFFIXES + (".txt",))
+    assert deploy._dependency_cache_path(zipfile.ZIP_DEFLATED, 9) != base
+
+
+def test_host_fallback_dependencies_are_not_cached(tmp_path, monkeypatch):
+    """Test that a host-platform fallback install never populates the dependency cache"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / deploy.REQUIREMENTS_FILE).write_text("requests==2.31.0\n")
+    (tmp_path / "lambda_function.py").write_text("def lambda_handler(event, context):\n    return {}\n")
+    
+    def fake_install(deploy_dir):
+        (deploy_dir / "requests").mkdir()
+        (deploy_dir / "requests" / "__init__.py").write_text("")
+        return deploy.INSTALL_HOST_FALLBACK
+    
+    monkeypatch.setattr(deploy, "_install_dependencies", fake_install)
+    
+    zip_path = deploy.create_deployment_package()
+    
+    _assert_archive_matches(zip_path, {
+        "requests/__init__.py": b"",
+        "lambda_function.py": b"def lambda_handler(event, context):\n    return {}\n",
+    })
+    assert not list((tmp_path / deploy.DEPLOY_CACHE_DIR).glob("*.zip"))
+    assert not (tmp_path / "deploy-dependencies.zip").exists()
@@ -2,6 +2,7 @@
 Tests for external API collectors with fallback mechanisms.
 """
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import requests
@@ -10,10 +11,12 @@ import json
 from src.data_collection.external_collectors import (
     APIConfig,
     RateLimiter,
+    SlidingWindowCounter,
     ExternalDataCollector,
     DominosAPIClient,
     FootballAPIClient,
     DataCollectionSystem,
+    MAX_BACKOFF_SECONDS,
     create_default_api_config
 )
 from src.models.pizza_order import DominosOrder
@@ -66,8 +69,8 @@ class TestRateLimiter:
         
         assert limiter.max_per_minute == 30
         assert limiter.max_per_hour == 500
-        assert len(limiter.minute_requests) == 0
-        assert len(limiter.hour_requests) == 0
+        assert limiter.minute_window.count == 0
+        assert limiter.hour_window.count == 0
     
     @patch('time.time')
     @patch('time.sleep')
@@ -79,8 +82,8 @@ class TestRateLimiter:
         limiter.wait_if_needed()
         
         mock_sleep.assert_not_called()
-        assert len(limiter.minute_requests) == 1
-        assert len(limiter.hour_requests) == 1
+        assert limiter.minute_window.count == 1
+        assert limiter.hour_window.count == 1
     
     @patch('time.time')
     @patch('time.sleep')
@@ -91,13 +94,44 @@ class TestRateLimiter:
         limiter = RateLimiter(max_per_minute=2, max_per_hour=1000)
         
         # Fill up the minute limit
-        limiter.minute_requests = [999.0, 999.5]  # Two requests in the last minute
+        # Two requests in the last minute
+        limiter.minute_window.record(999.0)
+        limiter.minute_window.record(999.5)
         limiter.wait_if_needed()
         
         # Should sleep for the remaining time in the minute
         mock_sleep.assert_called_once()
         sleep_time = mock_sleep.call_args[0][0]
         assert sleep_time > 0
+    
+    @patch('time.sleep')
+    def test_rate_limiter_shared_across_threads(self, mock_sleep):
+        """Test that concurrent callers of one limiter are all counted."""
+        limiter = RateLimiter(max_per_minute=10000, max_per_hour=10000)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(400):
+                executor.submit(limiter.wait_if_needed)
+        
+        mock_sleep.assert_not_called()
+        assert limiter.minute_window.count == 400
+        assert limiter.hour_window.count == 400
+    
+    def test_sliding_window_counter_expires_old_requests(self):
+        """Test that counted requests leave the window once it has fully passed."""
+        window = SlidingWindowCounter(60, 1)
+        window.record(1000.2)
+        window.record(1030.0)
+        
+        window.advance(1060.0)
+        assert window.count == 2  # Never forgotten before a full window
+        
+        window.advance(1061.0)
+        assert window.count == 1
+        assert window.seconds_until_expiry(1061.0) == pytest.approx(30.0)
+        
+        window.advance(5000.0)
+        assert window.count == 0
 
 
 class TestExternalDataCollector:
@@ -113,6 +147,18 @@ class TestExternalDataCollector:
         assert collector.session is not None
         assert collector.mock_generator is None
     
+    def test_collectors_share_rate_limiter_per_host(self):
+        """Test that collectors for the same host reuse one rate limiter."""
+        config = APIConfig(max_requests_per_minute=7)
+        
+        first = FootballAPIClient(config)
+        second = FootballAPIClient(config)
+        dominos = DominosAPIClient(config)
+        
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not dominos.rate_limiter
+        assert first.rate_limiter.max_per_minute == 7
+    
     @patch('requests.Session.get')
     def test_make_request_success(self, mock_get):
         """Test successful API request."""
@@ -129,6 +175,64 @@ class TestExternalDataCollector:
         assert response == mock_response
         mock_get.assert_called_once()
     
+    @patch('requests.Session.get')
+    def test_make_request_uses_response_cache(self, mock_get):
+        """Test that a repeated request is served from the response cache."""
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        config = APIConfig()
+        collector = ExternalDataCollector(config)
+        
+        params = {'dateFrom': '2024-01-01', 'dateTo': '2024-01-31'}
+        first = collector._make_request("https://api.example.com/test", params=params)
+        second = collector._make_request("https://api.example.com/test", params=dict(params))
+        
+        assert first is second
+        mock_get.assert_called_once()
+    
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_make_request_retries_with_retry_after(self, mock_get, mock_sleep):
+        """Test that a retryable status is retried after the Retry-After delay."""
+        throttled = Mock()
+        throttled.status_code = 429
+        throttled.headers = {'Retry-After': '7'}
+        success = Mock()
+        success.status_code = 200
+        success.raise_for_status.return_value = None
+        mock_get.side_effect = [throttled, success]
+        
+        config = APIConfig()
+        collector = ExternalDataCollector(config)
+        
+        response = collector._make_request("https://api.example.com/test")
+        
+        assert response == success
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+    
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_make_request_caps_retry_after(self, mock_get, mock_sleep):
+        """Test that an excessive Retry-After is clamped to the maximum backoff."""
+        throttled = Mock()
+        throttled.status_code = 503
+        throttled.headers = {'Retry-After': '86400'}
+        success = Mock()
+        success.status_code = 200
+        success.raise_for_status.return_value = None
+        mock_get.side_effect = [throttled, success]
+        
+        config = APIConfig()
+        collector = ExternalDataCollector(config)
+        
+        response = collector._make_request("https://api.example.com/test")
+        
+        assert response == success
+        mock_sleep.assert_called_once_with(MAX_BACKOFF_SECONDS)
+    
     @patch('requests.Session.get')
     def test_make_request_failure(self, mock_get):
         """Test failed API request."""
@@ -154,6 +258,17 @@ class TestExternalDataCollector:
         
         assert generator is not None
         assert collector.mock_generator == generator
+    
+    def test_get_mock_generator_keyed_on_date_range(self):
+        """Test that mock generators are reused per date range only."""
+        collector = ExternalDataCollector(APIConfig())
+        
+        january = collector._get_mock_generator(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        february = collector._get_mock_generator(datetime(2024, 2, 1), datetime(2024, 2, 29))
+        
+        assert january is not february
+        assert february.config.start_date == datetime(2024, 2, 1)
+        assert collector._get_mock_generator(datetime(2024, 1, 1), datetime(2024, 1, 31)) is january
 
 
 class TestDominosAPIClient:
@@ -459,6 +574,22 @@ class TestDataCollectionSystem:
             assert should_retry is True
             mock_sleep.assert_called_once()
     
+    def test_handle_api_errors_server_error_backoff_grows_with_attempt(self):
+        """Test that server-error backoff doubles per attempt and is capped."""
+        config = APIConfig(backoff_factor=1.0)
+        system = DataCollectionSystem(config)
+        
+        mock_response = Mock()
+        mock_response.status_code = 503
+        
+        with patch('time.sleep') as mock_sleep, patch('random.random', return_value=0.5):
+            system.handle_api_errors(mock_response, attempt=0)
+            system.handle_api_errors(mock_response, attempt=3)
+            system.handle_api_errors(mock_response, attempt=10)
+        
+        sleep_times = [call[0][0] for call in mock_sleep.call_args_list]
+        assert sleep_times == [1.5, 8.5, 60.5]
+    
     def test_handle_api_errors_auth_error(self):
         """Test handling authentication errors."""
         config = APIConfig()
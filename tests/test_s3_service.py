@@ -288,6 +288,26 @@ class TestS3Service:
         assert uploaded_data[0]['value'] == 100
         assert uploaded_data[1]['id'] == '2'
         assert uploaded_data[1]['value'] == 200
+        
+        # Datetimes keep the str() format written by json.dumps(default=str)
+        assert uploaded_data[0]['timestamp'] == '2024-01-15 00:00:00'
+    
+    @patch('src.storage.s3_service.boto3')
+    def test_upload_json_data_writes_nan_as_null(self, mock_boto3):
+        """Test that NaN values are uploaded as valid JSON null"""
+        mock_client = Mock()
+        mock_boto3.client.return_value = mock_client
+        mock_boto3.resource.return_value = Mock()
+        mock_client.head_bucket.return_value = {}
+        
+        service = S3Service()
+        
+        service.upload_json_data(
+            [{'id': 1, 'score': float('nan')}], 'dominos-orders', 'mock', 'test_nan'
+        )
+        
+        uploaded_data = json.loads(mock_client.put_object.call_args[1]['Body'])
+        assert uploaded_data == [{'id': 1, 'score': None}]
     
     @patch('src.storage.s3_service.boto3')
     def test_list_files_with_filters(self, mock_boto3):